@@ -1,8 +1,10 @@
 import streamlit as st
+from src.pages.admin_page import is_admin_request, render_admin_page
 from src.pages.auth_page import render_auth_page
 from src.pages.candidate_page import render_candidate_page
 from src.pages.recruiter_page import render_recruiter_page
 from src.utils.custom_logger import CustomLogger
+from src.utils.profiler import profile_rerun
 
 # Initialize logger
 logger = CustomLogger("MainApp")
@@ -16,6 +18,11 @@ def main():
             page_icon="📄"
         )
 
+        # Hidden operator page, reachable with ?admin=<ADMIN_KEY>
+        if is_admin_request():
+            render_admin_page()
+            return
+
         # Check authentication state
         if "token" not in st.session_state:
             logger.info("User not authenticated - rendering auth page")
@@ -24,8 +31,8 @@ def main():
             # Get user type from session state
             user_type = st.session_state.get("user_type", "")
             user_data = st.session_state.get("user_data", {})
-            logger.info(f"user_type: {user_type}")
-            logger.info(f"user_data: {user_data}")
+            logger.info("user_type: %s", user_type)
+            logger.info("user_data: %s", user_data)
             
             if user_type == "candidate":
                 logger.info("Rendering candidate dashboard")
@@ -42,4 +49,6 @@ def main():
         st.error("An unexpected error occurred. Please try again later.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Opt-in rerun profiling via PROFILE_RERUNS or ?profile=<PROFILE_KEY>
+    with profile_rerun("app"):
+        main()
\ No newline at end of file
@@ -0,0 +1,60 @@
+import os
+import streamlit as st
+from src.utils.custom_logger import CustomLogger
+from src.utils.metrics import METRICS_FILE, get_metrics
+from src.utils.profiler import profile_section
+
+logger = CustomLogger("AdminPage")
+
+# Key required in the ?admin= query parameter; the page is disabled when unset
+ADMIN_KEY = os.getenv("ADMIN_KEY", "")
+
+
+def is_admin_request() -> bool:
+    """Check whether the current URL asks for the admin page with the right key"""
+    if not ADMIN_KEY:
+        return False
+    if hasattr(st, "query_params"):
+        value = st.query_params.get("admin")
+    else:
+        value = st.experimental_get_query_params().get("admin", [None])[0]
+    return value == ADMIN_KEY
+
+
+@profile_section()
+def render_admin_page():
+    """Render backend call metrics for operators"""
+    st.title("Backend Metrics")
+
+    metrics = get_metrics()
+    rows = metrics.summary()
+
+    st.subheader("Endpoints")
+    if rows:
+        st.dataframe(rows, use_container_width=True)
+    else:
+        st.info("No backend calls recorded in this process yet.")
+
+    st.subheader("Prometheus Export")
+    exposition = metrics.render_prometheus()
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            "Download metrics",
+            exposition,
+            file_name="metrics.prom",
+            mime="text/plain",
+            use_container_width=True
+        )
+    with col2:
+        target = METRICS_FILE or os.path.join("logs", "metrics.prom")
+        if st.button(f"Write to {target}", use_container_width=True):
+            try:
+                metrics.write_file(target)
+                st.success(f"Metrics written to {target}")
+            except OSError as e:
+                logger.error("Failed to write metrics file: %s", str(e))
+                st.error(f"Failed to write metrics file: {e}")
+
+    with st.expander("Raw exposition", expanded=False):
+        st.code(exposition, language="text")
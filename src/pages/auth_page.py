@@ -1,10 +1,12 @@
 import streamlit as st
-import asyncio
 from src.services.auth_listener import AuthListener
+from src.utils.async_runner import run_async
 from src.utils.custom_logger import CustomLogger
+from src.utils.profiler import profile_section
 
 logger = CustomLogger("AuthPage")
 
+@profile_section()
 def render_login_page():
     st.title("Welcome Back!")
     
@@ -23,8 +25,8 @@ def render_login_page():
                 st.rerun()
         
         if submit:
-            result = asyncio.run(auth_listener.login(username, password))
-            logger.debug(f"Login result: {result}")
+            result = run_async(auth_listener.login(username, password))
+            logger.debug("Login result: %s", result)
             
             if "error" not in result:
                 st.session_state.update({
@@ -45,6 +47,7 @@ def render_login_page():
                 logger.error(f"Login failed: {result['error']}")
                 st.error(result["error"])
 
+@profile_section()
 def render_register_page():
     st.title("Create Account")
     
@@ -66,7 +69,7 @@ def render_register_page():
                 st.rerun()
         
         if submit:
-            result = asyncio.run(auth_listener.register(
+            result = run_async(auth_listener.register(
                 new_username, 
                 email, 
                 new_password, 
@@ -82,6 +85,7 @@ def render_register_page():
                 logger.error(f"Registration failed: {result['error']}")
                 st.error(result["error"])
 
+@profile_section()
 def render_profile_update():
     st.title("Update Profile")
     auth_listener = AuthListener()
@@ -97,7 +101,7 @@ def render_profile_update():
             if update_email:
                 update_data["email"] = update_email
                 
-            result = asyncio.run(auth_listener.update_profile(update_data))
+            result = run_async(auth_listener.update_profile(update_data))
             
             if "error" not in result:
                 st.session_state["user_data"].update(update_data)
@@ -107,6 +111,7 @@ def render_profile_update():
                 logger.error(f"Profile update failed: {result['error']}")
                 st.error(result["error"])
 
+@profile_section()
 def render_auth_page():
     if "show_register" not in st.session_state:
         st.session_state.show_register = False
@@ -1,12 +1,15 @@
-import os
 import streamlit as st
-import asyncio
+from src.pages.candidate_view import render_candidate
 from src.services.auth_listener import AuthListener
 from src.services.candidate_listener import CandidateListener
+from src.services.records import Candidate
+from src.utils.async_runner import run_async
 from src.utils.custom_logger import CustomLogger
+from src.utils.profiler import profile_section
 
 logger = CustomLogger("CandidatePage")
 
+@profile_section()
 def render_candidate_page(user_data: dict):
     """Render the candidate dashboard page"""
     try:
@@ -44,6 +47,7 @@ def render_candidate_page(user_data: dict):
         logger.error(f"Error in candidate page: {str(e)}")
         st.error("An unexpected error occurred. Please try again later.")
 
+@profile_section()
 def render_profile_section(user_data: dict):
     """Render recruiter profile section"""
     st.title("My Profile")
@@ -80,7 +84,7 @@ def render_profile_section(user_data: dict):
                 auth_listener = AuthListener()
                 if "token" in st.session_state:
                     auth_listener.update_token(st.session_state["token"])
-                result = asyncio.run(auth_listener.update_profile(update_data))
+                result = run_async(auth_listener.update_profile(update_data))
                 if "error" not in result:
                     # Update session state and show success
                     st.session_state["user_data"].update(update_data)
@@ -90,6 +94,7 @@ def render_profile_section(user_data: dict):
             else:
                 st.info("Please enter a new username or email to update.")
 
+@profile_section()
 def render_resume_section(candidate_listener: CandidateListener, user_data: dict):
     """Render resume management section"""
     st.title("Resume Management")
@@ -103,22 +108,19 @@ def render_resume_section(candidate_listener: CandidateListener, user_data: dict
         )
     
         if uploaded_file:
-            temp_path = f"temp_{uploaded_file.name}"
-            with open(temp_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
+            force = st.checkbox("Upload even if unchanged", key="force_resume_upload")
             col1, col2, col3 = st.columns([1, 2, 1])
             with col2:
                 if st.button("Upload Resume", type="primary", use_container_width=True):
                     with st.spinner("Uploading..."):
-                        result = asyncio.run(
-                            candidate_listener.upload_resume(temp_path, user_data.get('id'))
+                        # Stream straight from the uploaded buffer, no temp file
+                        result = run_async(
+                            candidate_listener.upload_resume(uploaded_file, user_data.get('id'), force=force)
                         )
                         
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
-                        
-                    if "error" not in result:
+                    if result.get("status") == "unchanged":
+                        st.info("Resume already up to date")
+                    elif "error" not in result:
                         st.success("Resume uploaded successfully!")
                     else:
                         st.error(result["error"])
@@ -129,62 +131,14 @@ def render_resume_section(candidate_listener: CandidateListener, user_data: dict
     st.subheader("Current Resume")
     if st.button("View Resume", use_container_width=True):
         with st.spinner("Loading..."):
-            result = asyncio.run(candidate_listener.get_resume(user_data.get('id')))
+            result = run_async(candidate_listener.get_resume(user_data.get('id')))
             
         if "error" not in result:
-            with st.expander(f"Candidate ID: {user_data.get('id', 'N/A')}", expanded=True):
-                st.write("**Candidate Information**")
-                # Personal Information
-                if "parsed_resume" in result:
-                    if result['parsed_resume']['personal_info']:
-                        st.subheader("Personal Information")
-                        for key, value in result['parsed_resume']['personal_info'].items():
-                            if value:  # Only show non-empty values
-                                st.write(f"**{key.title()}:** {value}")
-                    # Experience
-                    if result['parsed_resume']['experience']:
-                        st.subheader("Experience")
-                        for exp in result['parsed_resume']['experience']:
-                            st.write(f"**{exp.get('title')} at {exp.get('company')}**")
-                            st.write(f"*{exp.get('period')}*")
-                            for resp in exp.get('responsibilities', []):
-                                st.write(f"• {resp}")
-                        st.write("**Total Experience:**", result['total_experience'], "years")        
-
-                    # Education
-                    if result['parsed_resume']['education']:
-                        st.subheader("Education")
-                        for edu in result['parsed_resume']['education']:
-                            st.write(f"**{edu.get('degree')}**")
-                            st.write(f"*{edu.get('institution')}* ({edu.get('period')})")
-
-                    # Skills
-                    if result['parsed_resume']['skills']:
-                        if result['parsed_resume']['skills']['technical']:
-                            st.subheader("Technical Skills")
-                            for skill in result['parsed_resume']['skills']['technical']:
-                                st.markdown(f"• `{skill}`")
-                        if result['parsed_resume']['skills']['soft']:
-                            st.subheader("Soft Skills")
-                            for skill in result['parsed_resume']['skills']['soft']:
-                                st.markdown(f"• `{skill}`")
-
-                    # Certifications
-                    if result['parsed_resume']['certifications']:
-                        st.subheader("Certifications")
-                        for cert in result['parsed_resume']['certifications']:
-                            st.write(f"• {cert}")
-
-                    # Languages
-                    if result['parsed_resume']['languages']:
-                        st.subheader("Languages")
-                        for lang in result['parsed_resume']['languages']:
-                            st.write(f"• {lang}") 
-
+            candidate = Candidate.from_payload(result, keep_raw_text=True)
+            render_candidate(candidate, expanded=True, title=f"Candidate ID: {user_data.get('id', 'N/A')}")
+            if candidate.raw_text is not None:
                 st.subheader("Raw Text")
-                if "raw_text" in result:
-                    st.text_area("Extracted Text", result['raw_text'], height=300)                                           
+                st.text_area("Extracted Text", candidate.raw_text, height=300)
 
         else:
             st.error("Failed to load resume")
-
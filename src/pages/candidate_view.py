@@ -0,0 +1,332 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+import pandas as pd
+import streamlit as st
+from src.services.candidate_export import EXPORT_FORMATS, MIME_TYPES, export_candidates
+from src.services.candidate_table import SCORE_PREFIX, candidates_frame, refine, skill_facets, value_facets
+from src.services.records import Candidate
+from src.services.skill_index import SkillIndex
+
+CANDIDATE_RENDER_CACHE_SIZE = int(os.getenv("CANDIDATE_RENDER_CACHE_SIZE", "2048"))
+RESULTS_PAGE_SIZE = int(os.getenv("RESULTS_PAGE_SIZE", "20"))
+PAGE_SIZE_OPTIONS = [10, 20, 50, 100]
+
+_markdown_cache: "OrderedDict[Tuple[str, str, bool], str]" = OrderedDict()
+_markdown_cache_lock = threading.Lock()
+
+
+def _build_markdown(candidate: Candidate, include_scores: bool) -> str:
+    """Build the markdown document for one candidate"""
+    lines: List[str] = ["**Candidate Information**", ""]
+    parsed_resume = candidate.parsed_resume
+
+    if parsed_resume.personal_info:
+        lines += ["#### Personal Information"]
+        lines += [f"**{key.title()}:** {value}  " for key, value in parsed_resume.personal_info.items()]
+        lines.append("")
+
+    if parsed_resume.experience:
+        lines.append("#### Experience")
+        for exp in parsed_resume.experience:
+            lines += [f"**{exp.title} at {exp.company}**  ", f"*{exp.period}*", ""]
+            lines += [f"- {resp}" for resp in exp.responsibilities]
+            lines.append("")
+        if candidate.total_experience is not None:
+            lines += [f"**Total Experience:** {candidate.total_experience} years", ""]
+
+    if parsed_resume.education:
+        lines.append("#### Education")
+        for edu in parsed_resume.education:
+            lines += [f"**{edu.degree}**  ", f"*{edu.institution}* ({edu.period})", ""]
+
+    for skills, heading in (
+        (parsed_resume.technical_skills, "Technical Skills"),
+        (parsed_resume.soft_skills, "Soft Skills")
+    ):
+        if skills:
+            lines += [f"#### {heading}", " ".join(f"`{skill}`" for skill in skills), ""]
+
+    for items, heading in ((parsed_resume.certifications, "Certifications"), (parsed_resume.languages, "Languages")):
+        if items:
+            lines.append(f"#### {heading}")
+            lines += [f"- {item}" for item in items]
+            lines.append("")
+
+    if include_scores and candidate.match_scores:
+        lines.append("#### Ranking Information")
+        lines += [f"**{score_type}:** {score}  " for score_type, score in candidate.match_scores.items()]
+
+    return "\n".join(lines).strip()
+
+
+def candidate_markdown(candidate: Candidate, include_scores: bool = False) -> str:
+    """
+    Render a candidate as a single markdown document, memoized per process
+
+    Entries are keyed by candidate id plus the record's content digest, so an unchanged
+    candidate seen again in another search, ranking or session is not rebuilt.
+
+    Args:
+        candidate (Candidate): Candidate from a search, ranking or resume response
+        include_scores (bool): Append the candidate's ``match_scores``
+
+    Returns:
+        str: Markdown for the candidate
+    """
+    key = (str(candidate.id), candidate.digest, include_scores)
+    with _markdown_cache_lock:
+        markdown = _markdown_cache.get(key)
+        if markdown is not None:
+            _markdown_cache.move_to_end(key)
+            return markdown
+
+    markdown = _build_markdown(candidate, include_scores)
+    with _markdown_cache_lock:
+        _markdown_cache[key] = markdown
+        while len(_markdown_cache) > CANDIDATE_RENDER_CACHE_SIZE:
+            _markdown_cache.popitem(last=False)
+    return markdown
+
+
+def render_candidate(
+    candidate: Candidate,
+    include_scores: bool = False,
+    expanded: bool = False,
+    title: Optional[str] = None
+) -> None:
+    """
+    Render one candidate as an expander holding a single markdown element
+
+    Args:
+        candidate (Candidate): Candidate from a search, ranking or resume response
+        include_scores (bool): Show the candidate's ``match_scores``
+        expanded (bool): Whether the expander starts open
+        title (str, optional): Expander label, defaults to the candidate id
+    """
+    with st.expander(title or f"Candidate ID: {candidate.id if candidate.id is not None else 'N/A'}", expanded=expanded):
+        st.markdown(candidate_markdown(candidate, include_scores))
+
+
+def reset_result_view(key: str) -> None:
+    """
+    Forget per-result-set view state when a new result set arrives
+
+    Args:
+        key (str): Widget key prefix of the result list
+    """
+    st.session_state.pop(f"{key}_page", None)
+    st.session_state.pop(f"{key}_frame", None)
+    export = st.session_state.pop(f"{key}_export", None)
+    if export is not None:
+        export[1].close()
+
+
+def render_candidate_list(candidates: List[Candidate], key: str, include_scores: bool = False) -> None:
+    """
+    Render one page of candidates with details built only for opened entries
+
+    Callers should call ``reset_result_view`` when a new result set arrives
+    so it opens on the first page. Each candidate on the visible page gets a toggle; its markdown document is
+    only built and sent once the toggle is switched on. Candidates on other
+    pages are not rendered at all. Paging reruns the script without calling
+    the backend, so callers keep ``candidates`` in session state.
+
+    Args:
+        candidates (List[Candidate]): Full result set, already fetched
+        key (str): Widget key prefix, unique per result list on the page
+        include_scores (bool): Show each candidate's ``match_scores``
+    """
+    total = len(candidates)
+    if not total:
+        return
+
+    size_col, page_col, info_col = st.columns([1, 1, 2])
+    with size_col:
+        default_size = RESULTS_PAGE_SIZE if RESULTS_PAGE_SIZE in PAGE_SIZE_OPTIONS else PAGE_SIZE_OPTIONS[0]
+        page_size = st.selectbox(
+            "Per page", PAGE_SIZE_OPTIONS, index=PAGE_SIZE_OPTIONS.index(default_size), key=f"{key}_page_size"
+        )
+    pages = (total + page_size - 1) // page_size
+    # A larger page size or a new result set can leave the stored page out of range
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+    with page_col:
+        page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+    start = (int(page) - 1) * page_size
+    end = min(start + page_size, total)
+    with info_col:
+        st.caption(f"Showing {start + 1}-{end} of {total}")
+
+    for position, candidate in enumerate(candidates[start:end], start=start + 1):
+        candidate_id = candidate.id if candidate.id is not None else "N/A"
+        label = f"#{position} · Candidate ID: {candidate_id}" if include_scores else f"Candidate ID: {candidate_id}"
+        if st.toggle(label, key=f"{key}_open_{candidate_id}_{position}"):
+            st.markdown(candidate_markdown(candidate, include_scores))
+
+
+def result_frame(candidates: List[Candidate], key: str) -> pd.DataFrame:
+    """
+    Build the candidate frame for a result set once and keep it in session state
+
+    Args:
+        candidates (List[Candidate]): Result set held in session state
+        key (str): Session state key prefix of the result list
+
+    Returns:
+        pd.DataFrame: Frame built by ``candidates_frame``
+    """
+    # The frame is stored with the list it was built from; holding the list
+    # keeps its identity from being reused by another result set
+    cached = st.session_state.get(f"{key}_frame")
+    if cached is None or cached[0] is not candidates or len(cached[1]) != len(candidates):
+        cached = (candidates, candidates_frame(candidates))
+        st.session_state[f"{key}_frame"] = cached
+    return cached[1]
+
+
+def render_refine_controls(candidates: List[Candidate], key: str, scored: bool = False) -> List[Candidate]:
+    """
+    Render refine, sort and facet controls over an already fetched result set
+
+    Filtering and sorting run on a pandas frame in memory; no backend call is
+    made when a control changes.
+
+    Args:
+        candidates (List[Candidate]): Full result set
+        key (str): Widget key prefix, unique per result list on the page
+        scored (bool): Offer score threshold and score sorting
+
+    Returns:
+        List[Candidate]: The candidates that pass the filters, in the chosen order
+    """
+    frame = result_frame(candidates, key)
+    with st.expander("Refine results", expanded=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            location = st.text_input("Location contains", key=f"{key}_refine_location")
+            skills = st.multiselect(
+                "Must have skills", skill_facets(frame, top=200).index.tolist(), key=f"{key}_refine_skills"
+            )
+        with col2:
+            min_experience = st.number_input(
+                "Minimum experience (years)", min_value=0.0, step=0.5, key=f"{key}_refine_experience"
+            )
+            min_score = st.number_input(
+                "Minimum score", min_value=0.0, max_value=100.0, step=0.5, key=f"{key}_refine_score"
+            ) if scored else None
+
+        sort_options = {"Original order": None, "Experience": "total_experience", "Name": "name"}
+        if scored:
+            sort_options["Score"] = "rank_score"
+            sort_options.update({
+                column[len(SCORE_PREFIX):].replace("_", " ").title(): column
+                for column in frame.columns if column.startswith(SCORE_PREFIX)
+            })
+        sort_col, order_col = st.columns([3, 1])
+        with sort_col:
+            sort_label = st.selectbox("Sort by", list(sort_options), key=f"{key}_refine_sort")
+        with order_col:
+            ascending = st.checkbox("Ascending", key=f"{key}_refine_ascending")
+
+        refined = refine(
+            frame,
+            location=location,
+            min_experience=min_experience,
+            skills=skills,
+            min_score=min_score,
+            sort_by=sort_options[sort_label],
+            ascending=ascending
+        )
+
+        facet_col1, facet_col2 = st.columns(2)
+        with facet_col1:
+            st.caption("Top skills in refined results")
+            st.dataframe(skill_facets(refined, top=10).rename("candidates"), use_container_width=True)
+        with facet_col2:
+            st.caption("Locations in refined results")
+            st.dataframe(value_facets(refined, "location", top=10).rename("candidates"), use_container_width=True)
+
+    if len(refined) != len(frame):
+        st.caption(f"{len(refined)} of {len(frame)} candidates match the refine filters")
+    return [candidates[position] for position in refined.index]
+
+
+def session_skill_index() -> SkillIndex:
+    """Return this session's skill index over every candidate fetched so far"""
+    if "skill_index" not in st.session_state:
+        st.session_state["skill_index"] = SkillIndex()
+    return st.session_state["skill_index"]
+
+
+def render_skill_match(key: str) -> None:
+    """
+    Query the session's skill index with AND/OR/at-least-k skill matching
+
+    Args:
+        key (str): Widget key prefix
+    """
+    index = session_skill_index()
+    stats = index.stats()
+    if not stats["candidates"]:
+        return
+    with st.expander(f"Match skills across {stats['candidates']} fetched candidates", expanded=False):
+        skills = st.multiselect("Skills", index.vocabulary(), key=f"{key}_skills")
+        mode_col, k_col = st.columns([3, 1])
+        with mode_col:
+            mode = st.radio("Match", ["All", "Any", "At least"], horizontal=True, key=f"{key}_mode")
+        with k_col:
+            k = st.number_input("k", min_value=1, step=1, key=f"{key}_k", disabled=mode != "At least")
+        if not skills:
+            return
+        if mode == "All":
+            matches = index.query_all(skills)
+        elif mode == "Any":
+            matches = index.query_any(skills)
+        else:
+            matches = index.query_at_least(skills, int(k))
+        # Candidates with more of the selected skills first
+        counts = index.match_counts(skills)
+        ordered = sorted(matches, key=lambda candidate_id: (-counts[candidate_id], str(candidate_id)))
+        st.caption(f"{len(matches)} candidates match")
+        render_candidate_list(index.candidates(ordered), key=key)
+
+
+def render_export_controls(candidates: List[Candidate], key: str) -> None:
+    """
+    Offer the given candidates as a CSV or Parquet download
+
+    The file is written in chunks only when asked for and kept in session
+    state for the download button, so the backend is never queried again.
+
+    Args:
+        candidates (List[Candidate]): Candidates to export, in display order
+        key (str): Widget key prefix, unique per result list on the page
+    """
+    if not candidates:
+        return
+    format_col, prepare_col, download_col = st.columns([1, 1, 1])
+    with format_col:
+        export_format = st.selectbox("Export format", EXPORT_FORMATS, key=f"{key}_export_format")
+    with prepare_col:
+        if st.button(f"Prepare {len(candidates)} rows", use_container_width=True, key=f"{key}_export_prepare"):
+            with st.spinner("Writing export..."):
+                previous = st.session_state.pop(f"{key}_export", None)
+                if previous is not None:
+                    previous[1].close()
+                st.session_state[f"{key}_export"] = (export_format, export_candidates(candidates, export_format))
+
+    prepared = st.session_state.get(f"{key}_export")
+    if prepared is not None:
+        prepared_format, export_file = prepared
+        export_file.seek(0)
+        with download_col:
+            st.download_button(
+                f"Download {prepared_format}",
+                data=export_file,
+                file_name=f"{key}.{prepared_format.lower()}",
+                mime=MIME_TYPES[prepared_format],
+                use_container_width=True,
+                key=f"{key}_export_download"
+            )
@@ -1,12 +1,29 @@
+import os
+import queue
+import re
+from typing import List
+import pandas as pd
 import streamlit as st
-import asyncio
+from src.pages.candidate_view import (
+    render_candidate_list,
+    render_export_controls,
+    render_refine_controls,
+    render_skill_match,
+    reset_result_view,
+    session_skill_index
+)
+from src.services.candidate_listener import BULK_UPLOAD_CONCURRENCY, CandidateListener
+from src.services.candidate_table import candidates_frame, overlap_frame
 from src.services.job_listener import JobListener
+from src.services.records import Candidate, Job, rank_entries
 from src.services.auth_listener import AuthListener
+from src.utils.async_runner import get_runner, run_async
 from src.utils.custom_logger import CustomLogger
-import pandas as pd
+from src.utils.profiler import profile_section
 
 logger = CustomLogger("RecruiterPage")
 
+@profile_section()
 def render_recruiter_page(user_data: dict):
     """Render the recruiter dashboard page"""
     try:
@@ -27,7 +44,9 @@ def render_recruiter_page(user_data: dict):
                     "Create Job",
                     "Search Jobs",
                     "Search Candidates",
-                    "Rank Candidates"
+                    "Rank Candidates",
+                    "Ranking Dashboard",
+                    "Bulk Upload Resumes"
                 ],
                 index=0,  # Profile is default
                 label_visibility="collapsed"
@@ -49,11 +68,19 @@ def render_recruiter_page(user_data: dict):
             render_candidates_section(job_listener)
         elif selected_page == "Rank Candidates":
             render_rank_candidates_section(job_listener)
+        elif selected_page == "Ranking Dashboard":
+            render_ranking_dashboard_section(job_listener)
+        elif selected_page == "Bulk Upload Resumes":
+            candidate_listener = CandidateListener()
+            if "token" in st.session_state:
+                candidate_listener.update_token(st.session_state["token"])
+            render_bulk_upload_section(candidate_listener)
 
     except Exception as e:
         logger.error(f"Error in recruiter page: {str(e)}")
         st.error("An unexpected error occurred. Please try again later.")
 
+@profile_section()
 def render_profile_section(user_data: dict):
     """Render recruiter profile section"""
     st.title("My Profile")
@@ -90,7 +117,7 @@ def render_profile_section(user_data: dict):
                 auth_listener = AuthListener()
                 if "token" in st.session_state:
                     auth_listener.update_token(st.session_state["token"])
-                result = asyncio.run(auth_listener.update_profile(update_data))
+                result = run_async(auth_listener.update_profile(update_data))
                 if "error" not in result:
                     # Update session state and show success
                     st.session_state["user_data"].update(update_data)
@@ -100,6 +127,7 @@ def render_profile_section(user_data: dict):
             else:
                 st.info("Please enter a new username or email to update.")
 
+@profile_section()
 def render_create_job_section(job_listener: JobListener):
     """Render job creation section"""
     st.title("Create New Job")
@@ -120,7 +148,7 @@ def render_create_job_section(job_listener: JobListener):
                 "job_description": job_description
             }
             with st.spinner("Creating job posting..."):
-                result = asyncio.run(job_listener.create_job(job_data))
+                result = run_async(job_listener.create_job(job_data))
                 if "error" not in result:
                     st.success("Job posted successfully!")
                 else:
@@ -128,6 +156,7 @@ def render_create_job_section(job_listener: JobListener):
         else:
             st.warning("Please fill in all required fields")
 
+@profile_section()
 def render_manage_jobs_section(job_listener: JobListener):
     """Render job management section"""
     st.title("Job Management")
@@ -136,13 +165,21 @@ def render_manage_jobs_section(job_listener: JobListener):
         st.subheader("Search Job")
         search_col1, search_col2 = st.columns([4, 1])
         with search_col1:
-            job_id = st.text_input("Enter Job ID", placeholder="Enter the job ID to search", label_visibility="collapsed")
+            job_id_text = st.text_input(
+                "Enter Job ID",
+                placeholder="Enter the job ID to search, or several IDs separated by commas to compare",
+                label_visibility="collapsed"
+            )
         with search_col2:
             search_clicked = st.button("Search", type="primary", use_container_width=True)
 
-    if search_clicked and job_id:
+    job_ids = parse_ids(job_id_text)
+    job_id = job_ids[0] if job_ids else ""
+    if search_clicked and len(job_ids) > 1:
+        render_job_comparison(job_listener, job_ids)
+    elif search_clicked and job_id:
         with st.spinner("Fetching job details..."):
-            result = asyncio.run(job_listener.get_job(job_id))
+            result = run_async(job_listener.get_job(job_id))
             if "error" not in result:
                 st.success("Job found")
                 
@@ -150,22 +187,23 @@ def render_manage_jobs_section(job_listener: JobListener):
                     # Display job details in a more structured way
                     st.write("**Job Information**")
                     if isinstance(result, dict):
+                        job = Job.from_payload(result)
                         # Basic Information
                         st.subheader("Basic Information")
                         basic_fields = ["title", "company", "location", "required_experience"]
                         for field in basic_fields:
-                            if field in result:
-                                st.write(f"**{field.title()}:** {result[field]}")
+                            if getattr(job, field) is not None:
+                                st.write(f"**{field.title()}:** {getattr(job, field)}")
                         
                         # Job Description
-                        if "job_description" in result:
+                        if job.job_description is not None:
                             st.subheader("Job Description")
-                            st.write(result["job_description"])
+                            st.write(job.job_description)
                         
                         # Parsed JD Categories
-                        if "parsed_jd" in result:
+                        if job.parsed_jd is not None:
                             st.subheader("Parsed Job Description")
-                            parsed_jd = result["parsed_jd"]
+                            parsed_jd = job.parsed_jd
                             
                             if isinstance(parsed_jd, dict):
                                 # Display other categories
@@ -179,22 +217,16 @@ def render_manage_jobs_section(job_listener: JobListener):
                                             st.write(items)
 
                                 # Display Technical Skills
-                                if "skills" in parsed_jd:
-                                    skills = parsed_jd["skills"]
-                                    if "technical" in skills:
-                                        st.markdown("**Technical Skills**")
-                                        technical_skills = skills["technical"]
-                                        if isinstance(technical_skills, list):
-                                            for skill in technical_skills:
-                                                st.markdown(f"• `{skill}`")
+                                if job.technical_skills:
+                                    st.markdown("**Technical Skills**")
+                                    for skill in job.technical_skills:
+                                        st.markdown(f"• `{skill}`")
                                 
-                                    # Display Soft Skills
-                                    if "soft" in skills:
-                                        st.markdown("**Soft Skills**")
-                                        soft_skills = skills["soft"]
-                                        if isinstance(soft_skills, list):
-                                            for skill in soft_skills:
-                                                st.markdown(f"• `{skill}`")
+                                # Display Soft Skills
+                                if job.soft_skills:
+                                    st.markdown("**Soft Skills**")
+                                    for skill in job.soft_skills:
+                                        st.markdown(f"• `{skill}`")
                                 
                     else:
                         st.json(result)
@@ -204,13 +236,52 @@ def render_manage_jobs_section(job_listener: JobListener):
     elif search_clicked:
         st.warning("Please enter a Job ID")
 
+def jobs_comparison_table(job_ids: List[str], jobs: List[dict]) -> pd.DataFrame:
+    """One row per found job with the fields recruiters compare side by side"""
+    rows = []
+    for job_id, payload in zip(job_ids, jobs):
+        if "error" in payload:
+            continue
+        job = Job.from_payload(payload)
+        rows.append({
+            "job_id": job_id,
+            "title": job.title,
+            "company": job.company,
+            "location": job.location,
+            "required_experience": job.required_experience,
+            "technical_skills": ", ".join(job.technical_skills),
+            "soft_skills": ", ".join(job.soft_skills)
+        })
+    return pd.DataFrame(rows)
+
+@profile_section()
+def render_job_comparison(job_listener: JobListener, job_ids: List[str]):
+    """Fetch several jobs at once and compare them in one table"""
+    with st.spinner(f"Fetching {len(job_ids)} jobs..."):
+        batch = run_async(job_listener.get_jobs(job_ids))
+    found = len(job_ids) - len(batch["failed"])
+    st.success(f"Found {found} of {len(job_ids)} jobs ({batch['cached']} from cache)")
+    if found:
+        st.dataframe(jobs_comparison_table(job_ids, batch["jobs"]), use_container_width=True, hide_index=True)
+    for failure in batch["failed"]:
+        st.warning(f"Job {failure['job_id']} could not be loaded")
+        logger.error("Failed to retrieve job %s: %s", failure["job_id"], failure["error"])
+
+@profile_section()
 def render_candidates_section(job_listener: JobListener):
     """Render candidate search section"""
     st.title("Search Candidates")
     
     st.subheader("Search Filters")
     
+    skill_index = session_skill_index()
     skills = st.text_input("Skills (comma-separated)")
+    suggestions = [
+        skill for skill in skill_index.complete(skills.split(",")[-1])
+        if skill != skills.split(",")[-1].strip().lower()
+    ]
+    if suggestions:
+        st.caption("Known skills: " + ", ".join(suggestions))
     col1, col2 = st.columns(2)
     with col1:
         experience = st.number_input("Minimum Experience (years)", min_value=0)
@@ -225,64 +296,47 @@ def render_candidates_section(job_listener: JobListener):
         }
         
         with st.spinner("Searching candidates..."):
-            result = asyncio.run(job_listener.search_candidates(search_params))
-            if isinstance(result, list):
-                st.success(f"Found {len(result)} candidates!")
-                for candidate in result:
-                    with st.expander(f"Candidate ID: {candidate.get('id', 'N/A')}", expanded=False):
-                        st.write("**Candidate Information**")
-                        # Personal Information
-                        if "parsed_resume" in candidate:
-                            if candidate['parsed_resume']['personal_info']:
-                                st.subheader("Personal Information")
-                                for key, value in candidate['parsed_resume']['personal_info'].items():
-                                    if value:  # Only show non-empty values
-                                        st.write(f"**{key.title()}:** {value}")
-
-                            # Experience
-                            if candidate['parsed_resume']['experience']:
-                                st.subheader("Experience")
-                                for exp in candidate['parsed_resume']['experience']:
-                                    st.write(f"**{exp.get('title')} at {exp.get('company')}**")
-                                    st.write(f"*{exp.get('period')}*")
-                                    for resp in exp.get('responsibilities', []):
-                                        st.write(f"• {resp}")
-
-                            # Education
-                            if candidate['parsed_resume']['education']:
-                                st.subheader("Education")
-                                for edu in candidate['parsed_resume']['education']:
-                                    st.write(f"**{edu.get('degree')}**")
-                                    st.write(f"*{edu.get('institution')}* ({edu.get('period')})")
-
-                            # Skills
-                            if candidate['parsed_resume']['skills']:
-                                if candidate['parsed_resume']['skills']['technical']:
-                                    st.subheader("Technical Skills")
-                                    for skill in candidate['parsed_resume']['skills']['technical']:
-                                        st.markdown(f"• `{skill}`")
-                                if candidate['parsed_resume']['skills']['soft']:
-                                    st.subheader("Soft Skills")
-                                    for skill in candidate['parsed_resume']['skills']['soft']:
-                                        st.markdown(f"• `{skill}`")
-
-                            # Certifications
-                            if candidate['parsed_resume']['certifications']:
-                                st.subheader("Certifications")
-                                for cert in candidate['parsed_resume']['certifications']:
-                                    st.write(f"• {cert}")
-
-                            # Languages
-                            if candidate['parsed_resume']['languages']:
-                                st.subheader("Languages")
-                                for lang in candidate['parsed_resume']['languages']:
-                                    st.write(f"• {lang}")
-            elif isinstance(result, dict) and "error" in result:
-                logger.error(f"Search failed: {result['error']}")
+            page = run_async(job_listener.search_candidates_page(search_params))
+            if "error" not in page:
+                # Keep the results so paging and opening details do not search again
+                st.session_state["candidate_search"] = {"params": search_params, **page}
+                skill_index.add(page["candidates"])
+                reset_result_view("candidate_search")
+            else:
+                logger.error(f"Search failed: {page['error']}")
                 st.warning("At least one of the fields is required")
+
+    search = st.session_state.get("candidate_search")
+    if search is not None:
+        results = search["candidates"]
+        if search["has_more"]:
+            total = f" of {search['total']}" if search["total"] is not None else ""
+            st.success(f"Showing the first {len(results)}{total} matching candidates")
+        else:
+            st.success(f"Found {len(results)} candidates!")
+        refined = render_refine_controls(results, key="candidate_search")
+        render_export_controls(refined, key="candidate_search")
+        render_candidate_list(refined, key="candidate_search")
+
+        if search["has_more"] and st.button("Load more candidates", use_container_width=True):
+            with st.spinner("Fetching more candidates..."):
+                page = run_async(job_listener.search_candidates_page(
+                    search["params"],
+                    offset=search["next_offset"],
+                    cursor=search["next_cursor"],
+                    seen_ids={candidate.id for candidate in results}
+                ))
+            if "error" not in page:
+                search.update({**page, "candidates": results + page["candidates"]})
+                skill_index.add(page["candidates"])
+                st.rerun()
             else:
-                st.error("Unexpected response format from search")
+                logger.error(f"Search failed: {page['error']}")
+                st.error("Could not load more candidates")
 
+    render_skill_match(key="skill_match")
+
+@profile_section()
 def render_rank_candidates_section(job_listener: JobListener):
     """Render the candidate ranking section by Job ID"""
     st.title("Rank Candidates by Job")
@@ -292,82 +346,212 @@ def render_rank_candidates_section(job_listener: JobListener):
         min_score = st.number_input("Minimum Score", min_value=0.0, max_value=100.0, value=0.0, step=0.1)
     with col2:
         limit = st.number_input("Limit", min_value=1, max_value=100, value=10, step=1)
-    if st.button("Rank Candidates", use_container_width=True, type="primary"):
+    rank_col, refresh_col = st.columns([3, 1])
+    with rank_col:
+        rank_clicked = st.button("Rank Candidates", use_container_width=True, type="primary")
+    with refresh_col:
+        refresh_clicked = st.button("Refresh Ranking", use_container_width=True)
+    if rank_clicked or refresh_clicked:
         if job_id:
             with st.spinner("Ranking candidates..."):
                 # Pass min_score and limit as params
                 params = {"job_id": job_id, "min_score": min_score, "limit": int(limit)}
-                result = asyncio.run(job_listener.rank_candidates_with_params(params))
+                result = run_async(job_listener.rank_candidates_with_params(params, refresh=refresh_clicked))
                 if "error" not in result:
-                    # Robust handling for both dict and list
-                    if isinstance(result, list):
-                        candidates = result
-                    elif isinstance(result, dict):
-                        candidates = result.get("candidates", [])
-                    else:
-                        candidates = []
-                    if candidates:
-                        st.success(f"Found {len(candidates)} ranked candidates!")
-                        for candidate in candidates:
-                            with st.expander(f"Candidate ID: {candidate.get('id', 'N/A')}", expanded=False):
-                                st.write("**Candidate Information**")
-                                # Personal Information
-                                if "parsed_resume" in candidate:
-                                    if candidate['parsed_resume']['personal_info']:
-                                        st.subheader("Personal Information")
-                                        for key, value in candidate['parsed_resume']['personal_info'].items():
-                                            if value:  # Only show non-empty values
-                                                st.write(f"**{key.title()}:** {value}")
-
-                                    # Experience
-                                    if candidate['parsed_resume']['experience']:
-                                        st.subheader("Experience")
-                                        for exp in candidate['parsed_resume']['experience']:
-                                            st.write(f"**{exp.get('title')} at {exp.get('company')}**")
-                                            st.write(f"*{exp.get('period')}*")
-                                            for resp in exp.get('responsibilities', []):
-                                                st.write(f"• {resp}")
-
-                                    # Education
-                                    if candidate['parsed_resume']['education']:
-                                        st.subheader("Education")
-                                        for edu in candidate['parsed_resume']['education']:
-                                            st.write(f"**{edu.get('degree')}**")
-                                            st.write(f"*{edu.get('institution')}* ({edu.get('period')})")
-
-                                    # Skills
-                                    if candidate['parsed_resume']['skills']:
-                                        if candidate['parsed_resume']['skills']['technical']:
-                                            st.subheader("Technical Skills")
-                                            for skill in candidate['parsed_resume']['skills']['technical']:
-                                                st.markdown(f"• `{skill}`")
-                                        if candidate['parsed_resume']['skills']['soft']:
-                                            st.subheader("Soft Skills")
-                                            for skill in candidate['parsed_resume']['skills']['soft']:
-                                                st.markdown(f"• `{skill}`")
-
-                                    # Certifications
-                                    if candidate['parsed_resume']['certifications']:
-                                        st.subheader("Certifications")
-                                        for cert in candidate['parsed_resume']['certifications']:
-                                            st.write(f"• {cert}")
-
-                                    # Languages
-                                    if candidate['parsed_resume']['languages']:
-                                        st.subheader("Languages")
-                                        for lang in candidate['parsed_resume']['languages']:
-                                            st.write(f"• {lang}")
-
-                                st.subheader("Ranking Information")
-                                if 'match_scores' in candidate:
-                                    for score_type in candidate['match_scores']:
-                                        st.write(f"**{score_type}:** {candidate['match_scores'][score_type]}")
-                    else:
-                        st.info("No candidates ranked for this job.")
+                    st.session_state["ranking_results"] = rank_entries(result)
+                    session_skill_index().add(st.session_state["ranking_results"])
+                    reset_result_view("ranking")
                 else:
                     st.error(f"Failed to rank candidates: {result['error']}")
         else:
             st.warning("Please enter a Job ID")
 
+    candidates = st.session_state.get("ranking_results")
+    if candidates:
+        st.success(f"Found {len(candidates)} ranked candidates!")
+        refined = render_refine_controls(candidates, key="ranking", scored=True)
+        render_export_controls(refined, key="ranking")
+        render_candidate_list(refined, key="ranking", include_scores=True)
+    elif candidates is not None:
+        st.info("No candidates ranked for this job.")
+
+def parse_ids(text: str) -> List[str]:
+    """Split comma- or newline-separated IDs, dropping blanks and duplicates"""
+    ids = [part.strip() for part in re.split(r"[,\s]+", text)]
+    return list(dict.fromkeys(part for part in ids if part))
+
+def top_candidates_table(candidates: List[Candidate], top_n: int) -> pd.DataFrame:
+    """Compact rank/id/name/score table of a job's top candidates"""
+    frame = candidates_frame(candidates[:top_n])
+    frame.insert(0, "rank", range(1, len(frame) + 1))
+    return frame[["rank", "id", "name", "rank_score", "total_experience"]]
+
+@profile_section()
+def render_ranking_dashboard_section(job_listener: JobListener):
+    """Render concurrent ranking of several jobs with a cross-job overlap table"""
+    st.title("Ranking Dashboard")
+    job_ids = parse_ids(st.text_area("Job IDs (comma- or newline-separated)"))
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        min_score = st.number_input("Minimum Score", min_value=0.0, max_value=100.0, value=0.0, step=0.1)
+    with col2:
+        limit = st.number_input("Limit per job", min_value=1, max_value=100, value=10, step=1)
+    with col3:
+        top_n = st.number_input("Show top", min_value=1, max_value=100, value=5, step=1)
+    refresh = st.checkbox("Bypass cached rankings")
+
+    just_ranked = False
+    if st.button(f"Rank {len(job_ids)} Jobs", use_container_width=True, type="primary", disabled=not job_ids):
+        placeholders = {job_id: st.empty() for job_id in job_ids}
+        progress_bar = st.progress(0.0, text=f"0/{len(job_ids)} jobs ranked")
+        statuses = {}
+        updates = queue.Queue()
+
+        future = get_runner().submit(
+            job_listener.rank_jobs(
+                job_ids,
+                min_score=min_score,
+                limit=int(limit),
+                on_result=updates.put,
+                refresh=refresh
+            )
+        )
+        # Rankings arrive from the loop thread; show each one as soon as it lands
+        while len(statuses) < len(job_ids):
+            try:
+                status = updates.get(timeout=0.2)
+            except queue.Empty:
+                if future.done():
+                    break
+                continue
+            statuses[status["job_id"]] = status
+            with placeholders[status["job_id"]].container():
+                render_job_ranking(status, int(top_n))
+            progress_bar.progress(len(statuses) / len(job_ids), text=f"{len(statuses)}/{len(job_ids)} jobs ranked")
+        progress_bar.empty()
+        st.session_state["ranking_dashboard"] = {"summary": future.result(), "top_n": int(top_n)}
+        just_ranked = True
+
+    dashboard = st.session_state.get("ranking_dashboard")
+    if dashboard is None:
+        return
+    summary = dashboard["summary"]
+    message = (
+        f"Ranked {summary['succeeded']}/{len(summary['results'])} jobs in {summary['elapsed']:.1f}s "
+        f"(slowest single ranking {summary['slowest']:.1f}s)"
+    )
+    if summary["failed"]:
+        st.warning(message)
+    else:
+        st.success(message)
+    if not just_ranked:
+        for status in summary["results"]:
+            render_job_ranking(status, dashboard["top_n"])
+
+    rankings = {status["job_id"]: status["candidates"] for status in summary["results"] if "candidates" in status}
+    st.subheader("Candidates Ranked for Several Jobs")
+    overlap = overlap_frame(rankings)
+    if overlap.empty:
+        st.info("No candidate is ranked for more than one of these jobs.")
+    else:
+        st.dataframe(overlap, use_container_width=True, hide_index=True)
+
+def render_job_ranking(status: dict, top_n: int):
+    """Render one job's ranking outcome in the dashboard"""
+    if "error" in status:
+        st.error(f"Job {status['job_id']}: ranking failed ({status['error']})")
+        return
+    candidates = status["candidates"]
+    st.markdown(f"**Job {status['job_id']}** · {len(candidates)} candidates · {status['elapsed']:.1f}s")
+    if candidates:
+        st.dataframe(top_candidates_table(candidates, top_n), use_container_width=True, hide_index=True)
+
+def user_id_from_filename(filename: str) -> str:
+    """Default candidate user ID for a resume file: its name up to the first underscore"""
+    return os.path.splitext(os.path.basename(filename))[0].split("_", 1)[0].strip()
+
+@profile_section()
+def render_bulk_upload_section(candidate_listener: CandidateListener):
+    """Render bulk resume upload for many candidates with per-file progress"""
+    st.title("Bulk Upload Resumes")
+    st.caption(
+        "Each file is uploaded as the resume of one candidate. The user ID defaults to the file name "
+        "up to the first underscore (e.g. `1234_jane_doe.pdf` → `1234`); edit it below if needed."
+    )
+    uploaded_files = st.file_uploader(
+        "Choose PDF or DOCX files",
+        type=['pdf', 'docx'],
+        accept_multiple_files=True,
+        key="bulk_resume_uploader"
+    )
+    if not uploaded_files:
+        return
+
+    assignments = st.data_editor(
+        pd.DataFrame({
+            "file": [file.name for file in uploaded_files],
+            "user_id": [user_id_from_filename(file.name) for file in uploaded_files]
+        }),
+        disabled=["file"],
+        hide_index=True,
+        use_container_width=True,
+        key="bulk_resume_user_ids"
+    )
+    user_ids = [str(user_id).strip() if user_id is not None else "" for user_id in assignments["user_id"]]
+    missing = [name for name, user_id in zip(assignments["file"], user_ids) if not user_id]
+    duplicated = sorted({user_id for user_id in user_ids if user_id and user_ids.count(user_id) > 1})
+    if missing:
+        st.warning(f"{len(missing)} files have no user ID: {', '.join(missing[:5])}")
+    if duplicated:
+        st.warning(f"Several files are assigned to the same user: {', '.join(duplicated[:5])}")
+
+    concurrency = st.number_input(
+        "Parallel uploads", min_value=1, max_value=16, value=BULK_UPLOAD_CONCURRENCY, step=1
+    )
+    force = st.checkbox("Upload even if unchanged", key="force_bulk_upload")
+
+    total = len(uploaded_files)
+    if st.button(
+        f"Upload {total} Resumes", type="primary", use_container_width=True, disabled=bool(missing or duplicated)
+    ):
+        progress_bar = st.progress(0.0, text=f"0/{total} files processed")
+        status_table = st.empty()
+        statuses = []
+        updates = queue.Queue()
+
+        future = get_runner().submit(
+            candidate_listener.upload_resumes(
+                list(zip(uploaded_files, user_ids)),
+                concurrency=int(concurrency),
+                on_progress=updates.put,
+                force=force
+            )
+        )
+        # Progress callbacks arrive from the loop thread; render them here
+        while len(statuses) < total:
+            try:
+                status = updates.get(timeout=0.2)
+            except queue.Empty:
+                if future.done():
+                    break
+                continue
+            statuses.append(status)
+            progress_bar.progress(len(statuses) / total, text=f"{len(statuses)}/{total} files processed")
+            status_table.dataframe(
+                [{k: v for k, v in s.items() if k != "index"} for s in sorted(statuses, key=lambda s: s["index"])],
+                use_container_width=True
+            )
+        summary = future.result()
+
+        message = (
+            f"Uploaded resumes for {summary['succeeded']}/{total} candidates ({summary['unchanged']} already up to date) "
+            f"in {summary['elapsed']:.1f}s ({summary['files_per_second']:.2f} files/s)"
+        )
+        if summary["failed"]:
+            logger.error(f"Bulk upload had {summary['failed']} failed files")
+            st.warning(message)
+        else:
+            st.success(message)
+
 if __name__ == "__main__":
     render_recruiter_page({})
\ No newline at end of file
@@ -1,31 +1,43 @@
-import requests
 from typing import Dict, Optional
+from src.services.http_client import AsyncHttpClient, get_http_client
 from src.utils.custom_logger import CustomLogger
 
 logger = CustomLogger("AuthListener")
 
 class AuthListener:
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", client: Optional[AsyncHttpClient] = None):
         """
         Initialize the authentication listener
         
         Args:
             base_url (str): Base URL of the authentication service
+            client (AsyncHttpClient, optional): HTTP client to send requests with
         """
         self.base_url = base_url
-        self.headers = {
-            "Content-Type": "application/json"
-        }
+        self.client = client or get_http_client(base_url)
+        self.token: Optional[str] = None
         logger.info(f"AuthListener initialized with base URL: {base_url}")
 
     def update_token(self, token: str) -> None:
         """
-        Update the authorization header with new token
+        Update the token attached to authenticated requests
         
         Args:
             token (str): JWT token
         """
-        self.headers["Authorization"] = f"Bearer {token}"
+        self.token = token
+
+    def _headers(self) -> Dict[str, str]:
+        """
+        Build headers for a single request
+        
+        Returns:
+            Dict[str, str]: Request headers, with the bearer token if one is set
+        """
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
 
     async def register(self, username: str, email: str, password: str, user_type: str) -> Dict:
         """
@@ -50,13 +62,13 @@ class AuthListener:
             }
             
             logger.info(f"Attempting registration for user: {email}")
-            response = requests.post(endpoint, json=payload, headers=self.headers)
+            response = await self.client.post(endpoint, route="/auth/register", json=payload, headers=self._headers())
             
             if response.status_code == 200:
                 logger.info(f"Successfully registered user: {email}")
                 return response.json()
             else:
-                logger.error(f"Registration failed: {response.text}")
+                logger.error("Registration failed: %s", response.text)
                 return {"error": response.text}
                 
         except Exception as e:
@@ -82,7 +94,7 @@ class AuthListener:
             }
             
             logger.info(f"Attempting login for user: {username}")
-            response = requests.post(endpoint, data=payload)
+            response = await self.client.post(endpoint, route="/auth/token", data=payload)
             
             if response.status_code == 200:
                 token_data = response.json()
@@ -90,7 +102,7 @@ class AuthListener:
                 logger.info(f"Successfully logged in user: {username}")
                 return token_data
             else:
-                logger.error(f"Login failed: {response.text}")
+                logger.error("Login failed: %s", response.text)
                 return {"error": response.text}
                 
         except Exception as e:
@@ -111,13 +123,13 @@ class AuthListener:
             endpoint = f"{self.base_url}/auth/users/me"
             
             logger.info("Attempting to update user profile")
-            response = requests.put(endpoint, json=update_data, headers=self.headers)
+            response = await self.client.put(endpoint, route="/auth/users/me", json=update_data, headers=self._headers())
             
             if response.status_code == 200:
                 logger.info("Successfully updated user profile")
                 return response.json()
             else:
-                logger.error(f"Profile update failed: {response.text}")
+                logger.error("Profile update failed: %s", response.text)
                 return {"error": response.text}
                 
         except Exception as e:
@@ -131,4 +143,4 @@ class AuthListener:
         Returns:
             bool: True if authenticated, False otherwise
         """
-        return "Authorization" in self.headers
\ No newline at end of file
+        return self.token is not None
\ No newline at end of file
@@ -0,0 +1,176 @@
+import csv
+import io
+import os
+import tempfile
+from typing import IO, Any, Dict, Iterator, List, Optional
+from src.services.candidate_table import BASE_COLUMNS, SCORE_PREFIX, candidate_row
+from src.services.records import Candidate
+from src.utils.custom_logger import CustomLogger
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is optional
+    pa = None
+    pq = None
+
+logger = CustomLogger("CandidateExport")
+
+# Rows converted and written per chunk
+EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", "500"))
+# Exports up to this size are handed out from memory; larger ones are read from their temporary file
+EXPORT_SPOOL_BYTES = int(os.getenv("EXPORT_SPOOL_BYTES", str(8 * 1024 * 1024)))
+
+PARQUET_AVAILABLE = pq is not None
+EXPORT_FORMATS = ["CSV", "Parquet"] if PARQUET_AVAILABLE else ["CSV"]
+MIME_TYPES = {"CSV": "text/csv", "Parquet": "application/vnd.apache.parquet"}
+NUMERIC_COLUMNS = {"total_experience", "rank_score"}
+LIST_SEPARATOR = "; "
+
+
+def export_columns(candidates: List[Candidate]) -> List[str]:
+    """
+    Determine the export columns, one per match score type seen in the results
+
+    Only ``match_scores`` keys are scanned, so the header is known before any
+    row is built.
+    """
+    score_types = {
+        score_type
+        for candidate in candidates
+        for score_type in candidate.match_scores
+    }
+    return BASE_COLUMNS + sorted(f"{SCORE_PREFIX}{score_type}" for score_type in score_types)
+
+
+def export_row(candidate: Candidate) -> Dict:
+    """Flatten a candidate for export, joining skill lists into one cell"""
+    row = candidate_row(candidate)
+    for column in ("technical_skills", "soft_skills"):
+        row[column] = LIST_SEPARATOR.join(row[column])
+    return row
+
+
+def iter_chunks(candidates: List[Candidate], chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[List[Dict]]:
+    """Yield flattened rows ``chunk_rows`` at a time"""
+    for start in range(0, len(candidates), chunk_rows):
+        yield [export_row(candidate) for candidate in candidates[start:start + chunk_rows]]
+
+
+def numeric_value(value: Any) -> Optional[float]:
+    """Coerce a cell to a float, or None when it is not a number (e.g. "5 years")"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def write_csv(candidates: List[Candidate], target: IO[bytes], chunk_rows: int = EXPORT_CHUNK_ROWS) -> None:
+    """
+    Stream candidates as UTF-8 CSV into a binary file object, one chunk at a time
+
+    Args:
+        candidates (List[Candidate]): Candidates to export
+        target (IO[bytes]): Destination opened in binary mode
+        chunk_rows (int): Rows converted and written per chunk
+    """
+    text = io.TextIOWrapper(target, encoding="utf-8", newline="", write_through=True)
+    try:
+        writer = csv.DictWriter(text, fieldnames=export_columns(candidates), extrasaction="ignore")
+        writer.writeheader()
+        for rows in iter_chunks(candidates, chunk_rows):
+            writer.writerows(rows)
+    finally:
+        # Leave the target open for the caller
+        text.detach()
+
+
+def write_parquet(candidates: List[Candidate], target: IO[bytes], chunk_rows: int = EXPORT_CHUNK_ROWS) -> None:
+    """
+    Stream candidates into a Parquet file, one row group per chunk
+
+    Args:
+        candidates (List[Candidate]): Candidates to export
+        target (IO[bytes]): Destination opened in binary mode
+        chunk_rows (int): Rows per row group
+
+    Raises:
+        RuntimeError: If pyarrow is not installed
+    """
+    if not PARQUET_AVAILABLE:
+        raise RuntimeError("Parquet export requires pyarrow")
+    columns = export_columns(candidates)
+    schema = pa.schema([
+        (column, pa.float64() if column in NUMERIC_COLUMNS or column.startswith(SCORE_PREFIX) else pa.string())
+        for column in columns
+    ])
+    converters = {
+        column: numeric_value if schema.field(column).type == pa.float64() else str
+        for column in columns
+    }
+    with pq.ParquetWriter(target, schema) as writer:
+        for rows in iter_chunks(candidates, chunk_rows):
+            batch = {
+                column: [
+                    None if row.get(column) is None else converters[column](row[column])
+                    for row in rows
+                ]
+                for column in columns
+            }
+            writer.write_table(pa.table(batch, schema=schema))
+
+
+class ExportFile(io.BufferedReader):
+    """Read-only handle on a finished export that deletes the file when closed"""
+
+    def __init__(self, path: str):
+        super().__init__(io.FileIO(path, "rb"))
+        self.path = path
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+def export_candidates(candidates: List[Candidate], export_format: str = "CSV") -> IO[bytes]:
+    """
+    Export candidates through a temporary file
+
+    Rows are written to disk chunk by chunk. Exports up to EXPORT_SPOOL_BYTES
+    are then returned as an ``io.BytesIO``; larger ones as an ``ExportFile``
+    (an ``io.BufferedReader``) that removes the file on close. Both types are
+    accepted by ``st.download_button``.
+
+    Args:
+        candidates (List[Candidate]): Candidates to export
+        export_format (str): "CSV" or "Parquet"
+
+    Returns:
+        IO[bytes]: File object positioned at the start of the export
+    """
+    target = tempfile.NamedTemporaryFile(prefix="export-", delete=False)
+    try:
+        with target:
+            if export_format == "Parquet":
+                write_parquet(candidates, target)
+            else:
+                write_csv(candidates, target)
+            size = target.tell()
+        if size > EXPORT_SPOOL_BYTES:
+            # The export now owns the file and deletes it when closed
+            export = ExportFile(target.name)
+        else:
+            with open(target.name, "rb") as file:
+                export = io.BytesIO(file.read())
+            os.remove(target.name)
+    except BaseException:
+        if os.path.exists(target.name):
+            os.remove(target.name)
+        raise
+    logger.info("Exported %s candidates as %s (%s bytes)", len(candidates), export_format, size)
+    return export
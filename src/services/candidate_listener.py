@@ -1,61 +1,247 @@
-import requests
-from typing import Dict, Optional
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+import asyncio
 import os
+import time
+import aiohttp
+from src.services.conditional_get import cached_get_json
+from src.services.http_client import AsyncHttpClient, HttpResponse, get_http_client
+from src.services.resilience import CircuitOpenError
+from src.services.response_cache import ResponseCache, get_response_cache, principal_scope
+from src.services.upload_index import UploadIndex, content_hash, get_upload_index
 from src.utils.custom_logger import CustomLogger
 
 logger = CustomLogger("CandidateListener")
 
+RESUME_ENDPOINT = "/candidate/resume"
+BULK_UPLOAD_CONCURRENCY = int(os.getenv("BULK_UPLOAD_CONCURRENCY", "4"))
+BULK_UPLOAD_RETRIES = int(os.getenv("BULK_UPLOAD_RETRIES", "2"))
+
+# Upload failures worth another attempt in a bulk upload; anything else
+# (bad file, expired token, payload too large) fails the same way again
+TRANSIENT_UPLOAD_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, CircuitOpenError)
+
+
+def transient_status(status_code: int) -> bool:
+    """Whether an upload rejected with this status may succeed if retried"""
+    return status_code == 429 or status_code >= 500
+
+
+# A resume can be a path on disk, an in-memory buffer or a binary file object
+ResumeSource = Union[str, bytes, bytearray, memoryview, BinaryIO]
+
+
+def resume_filename(source: ResumeSource, filename: Optional[str] = None) -> str:
+    """Pick the filename sent with an upload"""
+    if filename:
+        return filename
+    if isinstance(source, str):
+        return os.path.basename(source)
+    name = getattr(source, "name", None)
+    if isinstance(name, str) and name:
+        return os.path.basename(name)
+    return "resume"
+
 class CandidateListener:
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        client: Optional[AsyncHttpClient] = None,
+        cache: Optional[ResponseCache] = None,
+        upload_index: Optional[UploadIndex] = None
+    ):
         """Initialize the candidate service listener"""
         self.base_url = base_url
-        self.headers = {}
+        self.client = client or get_http_client(base_url)
+        self.cache = cache or get_response_cache()
+        self.upload_index = upload_index or get_upload_index()
+        self.token: Optional[str] = None
         logger.info("CandidateListener initialized")
 
     def update_token(self, token: str) -> None:
-        """Update authorization header with token"""
-        self.headers["Authorization"] = f"Bearer {token}"
+        """Update the token attached to each request"""
+        self.token = token
 
-    def update_token(self, token: str) -> None:
-        """Update authorization header with token"""
-        self.headers["Authorization"] = f"Bearer {token}"
+    def _headers(self) -> Dict[str, str]:
+        """Build per-request headers with the bearer token if one is set"""
+        if self.token:
+            return {"Authorization": f"Bearer {self.token}"}
+        return {}
 
-    async def upload_resume(self, file_path: str, user_id: str) -> Dict:
+    async def upload_resume(
+        self,
+        source: ResumeSource,
+        user_id: str,
+        filename: Optional[str] = None,
+        force: bool = False
+    ) -> Dict:
         """
         Upload resume file to the server
+
+        File paths and file objects are streamed into the multipart body in
+        chunks; in-memory buffers are sent without being copied. Content the
+        user uploaded recently is not sent again unless ``force`` is set.
+
+        Args:
+            source (ResumeSource): Path, buffer or binary file object holding the resume
+            user_id (str): User ID the resume belongs to
+            filename (str, optional): Filename to send, defaults to the source's name
+            force (bool): Upload even if the same content was uploaded recently
+
+        Returns:
+            Dict: Upload response, or ``{"status": "unchanged", ...}`` if skipped.
+            Failures are ``{"error": ...}`` with the HTTP ``status_code`` when
+            the backend answered, and ``retryable`` set for transient ones
         """
         try:
             endpoint = f"{self.base_url}/candidate/upload_resume"
+            filename = resume_filename(source, filename)
 
-            if not os.path.exists(file_path):
-                logger.error(f"File not found: {file_path}")
+            if isinstance(source, str) and not os.path.exists(source):
+                logger.error(f"File not found: {source}")
                 return {"error": "File not found"}
 
-            # Prepare file for upload
-            with open(file_path, 'rb') as file:
-                files = {'file': (os.path.basename(file_path), file)}
-                data = {'user_id': user_id}
+            # Hash off the loop thread, large files take a while to read
+            digest = await asyncio.get_running_loop().run_in_executor(None, content_hash, source)
+            if not force and self.upload_index.is_latest(user_id, digest):
+                logger.info(f"Resume unchanged for user: {user_id}, skipping upload")
+                return {"status": "unchanged", "message": "Resume already up to date"}
 
-                logger.info(f"Attempting to upload resume for user: {user_id}")
-                # Only send Authorization header, not Content-Type
-                response = requests.post(
-                    endpoint,
-                    headers=self.headers,
-                    files=files,
-                    data=data
-                )
+            if isinstance(source, str):
+                with open(source, 'rb') as file:
+                    response = await self._post_resume(endpoint, file, filename, user_id)
+            else:
+                if hasattr(source, "seek"):
+                    # Rewind so retries and earlier reads still send the whole file
+                    source.seek(0)
+                response = await self._post_resume(endpoint, source, filename, user_id)
 
             if response.status_code == 200:
                 logger.info(f"Successfully uploaded resume for user: {user_id}")
+                self.cache.invalidate(RESUME_ENDPOINT, str(user_id))
+                self.upload_index.record(user_id, digest)
                 return response.json()
             else:
-                logger.error(f"Resume upload failed: {response.text}")
-                return {"error": response.text}
+                logger.error("Resume upload failed: %s", response.text)
+                return {
+                    "error": response.text,
+                    "status_code": response.status_code,
+                    "retryable": transient_status(response.status_code)
+                }
 
+        except TRANSIENT_UPLOAD_ERRORS as e:
+            logger.error(f"Resume upload error: {str(e) or type(e).__name__}")
+            return {"error": str(e) or type(e).__name__, "retryable": True}
         except Exception as e:
             logger.error(f"Resume upload error: {str(e)}")
             return {"error": str(e)}
 
+    async def _post_resume(
+        self,
+        endpoint: str,
+        body: Union[bytes, bytearray, memoryview, BinaryIO],
+        filename: str,
+        user_id: str
+    ) -> HttpResponse:
+        """Send the multipart upload request for one resume"""
+        data = aiohttp.FormData()
+        data.add_field('user_id', str(user_id))
+        data.add_field('file', body, filename=filename)
+
+        logger.info(f"Attempting to upload resume for user: {user_id}")
+        # Only send Authorization header, not Content-Type
+        return await self.client.post(
+            endpoint,
+            route="/candidate/upload_resume",
+            headers=self._headers(),
+            data=data
+        )
+
+    async def upload_resumes(
+        self,
+        uploads: List[Tuple[ResumeSource, str]],
+        concurrency: int = BULK_UPLOAD_CONCURRENCY,
+        max_retries: int = BULK_UPLOAD_RETRIES,
+        on_progress: Optional[Callable[[Dict], None]] = None,
+        force: bool = False
+    ) -> Dict:
+        """
+        Upload many candidates' resumes concurrently
+
+        The backend keeps one resume per user, so each file names the user it
+        belongs to. Only the first file of a batch is sent for any user; later
+        files for the same user are reported as failed instead of racing to
+        overwrite it.
+
+        Args:
+            uploads (List[Tuple[ResumeSource, str]]): (path, buffer or file object, user ID) per file
+            concurrency (int): Maximum number of uploads in flight
+            max_retries (int): Extra attempts for each file failing transiently
+            on_progress (Callable, optional): Called with each file's status as it completes
+            force (bool): Upload files even if their content was uploaded recently
+
+        Returns:
+            Dict: Per-file statuses in input order plus batch totals and throughput
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        started = time.monotonic()
+        logger.info(f"Starting bulk upload of {len(uploads)} resumes")
+        first_for_user: Dict[str, int] = {}
+        for index, (_, user_id) in enumerate(uploads):
+            first_for_user.setdefault(str(user_id), index)
+
+        async def upload_one(index: int, source: ResumeSource, user_id: str) -> Dict:
+            async with semaphore:
+                file_started = time.monotonic()
+                attempts = 0
+                result: Dict = {}
+                if first_for_user[str(user_id)] != index:
+                    result = {"error": f"Another file in this batch is already uploaded for user {user_id}"}
+                else:
+                    while attempts <= max_retries:
+                        attempts += 1
+                        result = await self.upload_resume(source, user_id, force=force)
+                        if "error" not in result or not result.get("retryable"):
+                            break
+                        if attempts <= max_retries:
+                            await asyncio.sleep(0.5 * 2 ** (attempts - 1))
+                if "error" in result:
+                    outcome = "failed"
+                elif result.get("status") == "unchanged":
+                    outcome = "unchanged"
+                else:
+                    outcome = "uploaded"
+                status = {
+                    "index": index,
+                    "file": resume_filename(source),
+                    "user_id": str(user_id),
+                    "status": outcome,
+                    "attempts": attempts,
+                    "elapsed": time.monotonic() - file_started
+                }
+                if "error" in result:
+                    status["error"] = result["error"]
+                if on_progress:
+                    on_progress(status)
+                return status
+
+        results = await asyncio.gather(
+            *(upload_one(index, source, user_id) for index, (source, user_id) in enumerate(uploads))
+        )
+        elapsed = time.monotonic() - started
+        succeeded = sum(1 for status in results if status["status"] == "uploaded")
+        unchanged = sum(1 for status in results if status["status"] == "unchanged")
+        logger.info(
+            f"Bulk upload finished: {succeeded}/{len(uploads)} uploaded, {unchanged} unchanged in {elapsed:.2f}s"
+        )
+        return {
+            "results": list(results),
+            "succeeded": succeeded,
+            "unchanged": unchanged,
+            "failed": len(uploads) - succeeded - unchanged,
+            "elapsed": elapsed,
+            "files_per_second": len(uploads) / elapsed if elapsed > 0 else 0.0
+        }
+
 
     async def get_resume(self, user_id: str) -> Dict:
         """
@@ -68,17 +254,21 @@ class CandidateListener:
             Dict: Resume details
         """
         try:
-            endpoint = f"{self.base_url}/candidate/resume"
-            
-            logger.info(f"Fetching resume for user: {user_id}")
-            response = requests.get(endpoint, headers=self.headers)
-            
-            if response.status_code == 200:
-                logger.info(f"Successfully retrieved resume for user: {user_id}")
-                return response.json()
+            endpoint = f"{self.base_url}{RESUME_ENDPOINT}"
+            cache_key = (RESUME_ENDPOINT, str(user_id), principal_scope(self.token))
+
+            fetch = await cached_get_json(
+                self.client, self.cache, cache_key, endpoint, route=RESUME_ENDPOINT, headers=self._headers()
+            )
+            if fetch.source == "cache":
+                logger.info(f"Serving cached resume for user: {user_id}")
+                return fetch.value
+            if fetch.value is not None:
+                logger.info(f"Successfully retrieved resume for user: {user_id} ({fetch.source})")
+                return fetch.value
             else:
-                logger.error(f"Resume retrieval failed: {response.text}")
-                return {"error": response.text}
+                logger.error("Resume retrieval failed: %s", fetch.response.text)
+                return {"error": fetch.response.text}
                 
         except Exception as e:
             logger.error(f"Resume retrieval error: {str(e)}")
@@ -0,0 +1,158 @@
+from typing import Dict, Iterable, List, Optional
+import pandas as pd
+from src.services.records import Candidate
+
+# Columns every candidate frame has, in display order; match score columns follow
+BASE_COLUMNS = [
+    "id", "name", "email", "location", "total_experience", "rank_score",
+    "technical_skills", "soft_skills", "latest_title", "latest_company"
+]
+SCORE_PREFIX = "score_"
+
+
+def candidate_row(candidate: Candidate) -> Dict:
+    """
+    Flatten a candidate record into one table row
+
+    Args:
+        candidate (Candidate): Candidate from a search or ranking response
+
+    Returns:
+        Dict: Scalar fields, skill lists and one ``score_<name>`` per match score
+    """
+    parsed_resume = candidate.parsed_resume
+    latest = parsed_resume.experience[0] if parsed_resume.experience else None
+    row = {
+        "id": candidate.id,
+        "name": parsed_resume.name,
+        "email": parsed_resume.email,
+        "location": candidate.location,
+        "total_experience": candidate.total_experience,
+        "rank_score": candidate.score,
+        "technical_skills": list(parsed_resume.technical_skills),
+        "soft_skills": list(parsed_resume.soft_skills),
+        "latest_title": latest.title if latest else None,
+        "latest_company": latest.company if latest else None
+    }
+    for score_type, score in candidate.match_scores.items():
+        if isinstance(score, (int, float)):
+            row[f"{SCORE_PREFIX}{score_type}"] = score
+    return row
+
+
+def candidates_frame(candidates: List[Candidate]) -> pd.DataFrame:
+    """
+    Load a result set into a columnar frame for in-memory refine, sort and facets
+
+    The frame index is each candidate's position in ``candidates``, so a
+    refined frame maps straight back to the original records. A hidden
+    ``_skill_tokens`` column holds every skill lowercased between ``|``
+    delimiters so skill filters run as vectorized substring matches.
+
+    Args:
+        candidates (List[Candidate]): Candidates from a search or ranking response
+
+    Returns:
+        pd.DataFrame: One row per candidate
+    """
+    frame = pd.DataFrame([candidate_row(candidate) for candidate in candidates])
+    for column in BASE_COLUMNS:
+        if column not in frame:
+            frame[column] = pd.Series(dtype="object")
+    frame["total_experience"] = pd.to_numeric(frame["total_experience"], errors="coerce")
+    frame["rank_score"] = pd.to_numeric(frame["rank_score"], errors="coerce")
+    frame["_skill_tokens"] = (
+        "|" + (frame["technical_skills"] + frame["soft_skills"]).map(lambda skills: "|".join(skills)).str.lower() + "|"
+        if len(frame) else pd.Series(dtype="object")
+    )
+    score_columns = sorted(column for column in frame.columns if column.startswith(SCORE_PREFIX))
+    return frame[BASE_COLUMNS + score_columns + ["_skill_tokens"]]
+
+
+def refine(
+    frame: pd.DataFrame,
+    location: Optional[str] = None,
+    min_experience: Optional[float] = None,
+    skills: Optional[Iterable[str]] = None,
+    min_score: Optional[float] = None,
+    sort_by: Optional[str] = None,
+    ascending: bool = False
+) -> pd.DataFrame:
+    """
+    Filter and sort a candidate frame without another backend call
+
+    Args:
+        frame (pd.DataFrame): Frame built by ``candidates_frame``
+        location (str, optional): Case-insensitive substring of the location
+        min_experience (float, optional): Minimum total years of experience
+        skills (Iterable[str], optional): Skills every remaining candidate must have
+        min_score (float, optional): Minimum ranking score
+        sort_by (str, optional): Column to sort by; original order otherwise
+        ascending (bool): Sort direction
+
+    Returns:
+        pd.DataFrame: Matching rows, index preserved
+    """
+    mask = pd.Series(True, index=frame.index)
+    if location:
+        mask &= frame["location"].fillna("").str.contains(location, case=False, regex=False)
+    if min_experience:
+        mask &= frame["total_experience"] >= min_experience
+    for skill in skills or []:
+        mask &= frame["_skill_tokens"].str.contains(f"|{skill.strip().lower()}|", regex=False)
+    if min_score:
+        mask &= frame["rank_score"] >= min_score
+    refined = frame[mask]
+    if sort_by:
+        refined = refined.sort_values(sort_by, ascending=ascending, na_position="last", kind="stable")
+    return refined
+
+
+def skill_facets(frame: pd.DataFrame, column: str = "technical_skills", top: int = 20) -> pd.Series:
+    """
+    Count how many candidates list each skill
+
+    Args:
+        frame (pd.DataFrame): Frame built by ``candidates_frame``, possibly refined
+        column (str): ``technical_skills`` or ``soft_skills``
+        top (int): Number of most common skills returned
+
+    Returns:
+        pd.Series: Candidate count per skill, most common first
+    """
+    return frame[column].explode().dropna().value_counts().head(top)
+
+
+def value_facets(frame: pd.DataFrame, column: str, top: int = 20) -> pd.Series:
+    """Count candidates per distinct value of a scalar column, most common first"""
+    return frame[column].dropna().value_counts().head(top)
+
+
+def overlap_frame(rankings: Dict[str, List[Candidate]]) -> pd.DataFrame:
+    """
+    Cross-job candidate overlap: which candidates rank for more than one job
+
+    Args:
+        rankings (Dict[str, List[Candidate]]): Ranked candidates per job id, best first
+
+    Returns:
+        pd.DataFrame: One row per candidate ranked for two or more jobs, with
+        the number of jobs, the best score and the candidate's rank for each job
+    """
+    long = pd.DataFrame([
+        {"candidate_id": candidate.id, "job_id": str(job_id), "rank": rank, "score": candidate.score}
+        for job_id, candidates in rankings.items()
+        for rank, candidate in enumerate(candidates, start=1)
+        if candidate.id is not None
+    ], columns=["candidate_id", "job_id", "rank", "score"])
+    if long.empty:
+        return pd.DataFrame(columns=["candidate_id", "jobs", "best_score"])
+
+    long = long.drop_duplicates(["candidate_id", "job_id"])
+    long["score"] = pd.to_numeric(long["score"], errors="coerce")
+    summary = long.groupby("candidate_id").agg(jobs=("job_id", "nunique"), best_score=("score", "max"))
+    summary = summary[summary["jobs"] > 1]
+    ranks = long.pivot(index="candidate_id", columns="job_id", values="rank")
+    ranks.columns = [f"rank_{job_id}" for job_id in ranks.columns]
+    overlap = summary.join(ranks, how="left").reset_index()
+    return overlap.sort_values(["jobs", "best_score"], ascending=[False, False], na_position="last")
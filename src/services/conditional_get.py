@@ -0,0 +1,81 @@
+from typing import Any, Dict, Optional
+from src.services.http_client import AsyncHttpClient, HttpResponse
+from src.services.response_cache import CacheKey, ResponseCache
+from src.utils.custom_logger import CustomLogger
+
+logger = CustomLogger("ConditionalGet")
+
+
+class CachedFetch:
+    """Outcome of a cache-aware GET"""
+
+    __slots__ = ("value", "response", "source")
+
+    def __init__(self, value: Optional[Any], response: Optional[HttpResponse], source: str):
+        """
+        Args:
+            value (Any, optional): Decoded JSON body, or None if the request failed
+            response (HttpResponse, optional): Backend response, None when served from cache
+            source (str): "cache", "revalidated" or "network"
+        """
+        self.value = value
+        self.response = response
+        self.source = source
+
+
+async def cached_get_json(
+    client: AsyncHttpClient,
+    cache: ResponseCache,
+    key: CacheKey,
+    url: str,
+    *,
+    route: str,
+    headers: Dict[str, str],
+    params: Optional[Dict] = None,
+    lookup_fresh: bool = True
+) -> CachedFetch:
+    """
+    GET a JSON resource through the response cache, revalidating stale copies
+
+    A fresh cached copy is returned without a request. A stale copy with an
+    ``ETag`` or ``Last-Modified`` validator is revalidated with
+    ``If-None-Match``/``If-Modified-Since``; on 304 the cached body is reused
+    and the bytes that did not have to be sent are recorded per route.
+    Successful full responses are cached together with their validators.
+
+    Args:
+        client (AsyncHttpClient): Shared HTTP client
+        cache (ResponseCache): Response cache holding the resource
+        key (CacheKey): (endpoint, id, scope) cache key
+        url (str): Absolute URL of the resource
+        route (str): Route template for timeouts and metrics
+        headers (Dict[str, str]): Request headers, including authorization
+        params (Dict, optional): Query string parameters
+        lookup_fresh (bool): Look for a fresh cached copy first; pass False
+            when the caller has just found none, so the miss is not counted twice
+
+    Returns:
+        CachedFetch: The value and where it came from; ``value`` is None on a failed request
+    """
+    cached = cache.get(key) if lookup_fresh else None
+    if cached is not None:
+        return CachedFetch(cached, None, "cache")
+
+    stale = cache.get_stale(key)
+    if stale is not None:
+        headers = {**headers, **stale.conditional_headers()}
+    response = await client.get(url, route=route, params=params, headers=headers)
+
+    if response.status_code == 304 and stale is not None:
+        logger.debug("%s not modified, reusing cached body", route)
+        cache.revalidated(key, stale)
+        client.metrics.record_saved("GET", route, "not_modified", stale.size)
+        return CachedFetch(stale.value, response, "revalidated")
+    if response.status_code == 200:
+        value = response.json()
+        cache.set(
+            key, value, len(response.content),
+            etag=response.header("ETag"), last_modified=response.header("Last-Modified")
+        )
+        return CachedFetch(value, response, "network")
+    return CachedFetch(None, response, "network")
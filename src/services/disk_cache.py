@@ -0,0 +1,341 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import streamlit as st
+from src.utils.custom_logger import CustomLogger
+from src.utils.fast_json import dumps, loads
+from src.utils.metrics import get_metrics, stats_families
+
+logger = CustomLogger("DiskCache")
+
+# Persistent cache is off unless a directory is configured
+DISK_CACHE_DIR = os.getenv("DISK_CACHE_DIR", "")
+DISK_CACHE_MAX_BYTES = int(os.getenv("DISK_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# Seconds a persisted response is served without asking the backend again
+DISK_CACHE_TTL = float(os.getenv("DISK_CACHE_TTL", "300"))
+# Bump when the stored payload format changes so old entries are ignored
+DISK_CACHE_FORMAT_VERSION = 1
+# Only refresh an entry's last access time this often, to keep reads mostly read-only
+ACCESS_UPDATE_INTERVAL = 60.0
+
+CacheKey = Tuple[str, Hashable, str]
+# (endpoint, item id or None, scope or None) pattern of a pending invalidation
+Tombstone = Tuple[str, Optional[str], Optional[str]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    endpoint TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    format_version INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (endpoint, item_id, scope)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+class DiskEntry:
+    """A cached response read back from disk"""
+
+    __slots__ = ("value", "size", "etag", "last_modified", "stored_at", "expires_at")
+
+    def __init__(
+        self,
+        value: Any,
+        size: int,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        stored_at: float,
+        expires_at: float
+    ):
+        self.value = value
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+    @property
+    def age(self) -> float:
+        return max(0.0, time.time() - self.stored_at)
+
+
+class DiskCache:
+    """
+    SQLite-backed response cache shared by every Streamlit worker on a node.
+
+    Entries survive restarts and are keyed like the in-memory response cache.
+    Each carries an expiry time and the response's ``ETag``/``Last-Modified``
+    validators; expired entries are kept until evicted so they can be
+    revalidated instead of downloaded again. The database runs in WAL mode so
+    readers in other processes are not blocked by a writer, and writes wait on
+    SQLite's lock rather than failing. Least recently used entries are evicted
+    once the byte budget is exceeded.
+
+    Reads run on the caller's thread; stores, access-time updates and
+    invalidations go through a background writer so callers on the event loop
+    do not wait on another process holding the write lock. Until a queued
+    invalidation has run, a tombstone hides the entries it covers from reads
+    in this process.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DISK_CACHE_MAX_BYTES, default_ttl: float = DISK_CACHE_TTL):
+        """
+        Initialize the disk cache
+
+        Args:
+            directory (str): Directory holding the cache database
+            max_bytes (int): Maximum total size of cached response bodies
+            default_ttl (float): Seconds an entry stays fresh unless overridden
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "responses.sqlite3")
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._local = threading.local()
+        self._writes: "queue.Queue[Callable[[sqlite3.Connection], None]]" = queue.Queue(maxsize=1024)
+        self._tombstones: Dict[Tombstone, float] = {}
+        self._tombstones_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+        self.dropped_writes = 0
+        self._connection().executescript(_SCHEMA)
+        threading.Thread(target=self._write_loop, name="DiskCacheWriter", daemon=True).start()
+        logger.info(f"DiskCache initialized at {self.path} (max bytes: {max_bytes})")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _write_loop(self) -> None:
+        """Apply queued writes one by one on the writer thread"""
+        while True:
+            write = self._writes.get()
+            try:
+                write(self._connection())
+            except Exception as e:
+                # Any failure only loses this write; the thread must keep serving the queue
+                self.errors += 1
+                logger.warning("Disk cache write failed: %s", str(e))
+
+    def _enqueue_write(self, write: Callable[[sqlite3.Connection], None]) -> None:
+        """Hand a write to the writer thread, dropping it if the writer is backed up"""
+        try:
+            self._writes.put_nowait(write)
+        except queue.Full:
+            self.dropped_writes += 1
+
+    def _invalidated(self, endpoint: str, item_id: str, scope: str, stored_at: float) -> bool:
+        """Check whether a pending invalidation covers an entry stored at ``stored_at``"""
+        with self._tombstones_lock:
+            if not self._tombstones:
+                return False
+            return any(
+                self._tombstones.get(pattern, -1.0) >= stored_at
+                for pattern in (
+                    (endpoint, None, None), (endpoint, item_id, None), (endpoint, None, scope), (endpoint, item_id, scope)
+                )
+            )
+
+    def get(self, key: CacheKey) -> Optional[DiskEntry]:
+        """
+        Read an entry, fresh or expired
+
+        Args:
+            key (CacheKey): (endpoint, id, scope) tuple
+
+        Returns:
+            DiskEntry: The stored entry (check ``fresh``), or None
+        """
+        endpoint, item_id, scope = key
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT value, size, etag, last_modified, stored_at, expires_at, accessed_at FROM entries "
+                "WHERE endpoint = ? AND item_id = ? AND scope = ? AND format_version = ?",
+                (endpoint, str(item_id), scope, DISK_CACHE_FORMAT_VERSION)
+            ).fetchone()
+            if row is None or self._invalidated(endpoint, str(item_id), scope, row[4]):
+                self.misses += 1
+                return None
+            now = time.time()
+            if now - row[6] > ACCESS_UPDATE_INTERVAL:
+                self._enqueue_write(lambda connection: connection.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE endpoint = ? AND item_id = ? AND scope = ?",
+                    (now, endpoint, str(item_id), scope)
+                ))
+            self.hits += 1
+            return DiskEntry(loads(row[0]), row[1], row[2], row[3], row[4], row[5])
+        except (sqlite3.Error, ValueError) as e:
+            self.errors += 1
+            logger.warning("Disk cache read failed: %s", str(e))
+            return None
+
+    def set(
+        self,
+        key: CacheKey,
+        value: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        ttl: Optional[float] = None
+    ) -> None:
+        """
+        Store a value with its validators, evicting old entries to stay within budget
+
+        Args:
+            key (CacheKey): (endpoint, id, scope) tuple
+            value (Any): JSON-serializable response
+            etag (str, optional): ``ETag`` header of the response
+            last_modified (str, optional): ``Last-Modified`` header of the response
+            ttl (float, optional): Seconds the entry stays fresh
+        """
+        endpoint, item_id, scope = key
+        now = time.time()
+        expires_at = now + (self.default_ttl if ttl is None else ttl)
+
+        def write(connection: sqlite3.Connection) -> None:
+            # Encoded here so large payloads are not serialized on the caller's thread
+            encoded = dumps(value)
+            size = len(encoded.encode("utf-8"))
+            if size > self.max_bytes:
+                return
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (endpoint, str(item_id), scope, DISK_CACHE_FORMAT_VERSION, encoded, size,
+                     etag, last_modified, now, expires_at, now)
+                )
+                self._evict(connection)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+        self._enqueue_write(write)
+
+    def touch(self, key: CacheKey, ttl: Optional[float] = None) -> None:
+        """Mark an entry fresh again after the backend confirmed it is unchanged"""
+        endpoint, item_id, scope = key
+        now = time.time()
+        expires_at = now + (self.default_ttl if ttl is None else ttl)
+        self._enqueue_write(lambda connection: connection.execute(
+            "UPDATE entries SET expires_at = ?, accessed_at = ? WHERE endpoint = ? AND item_id = ? AND scope = ?",
+            (expires_at, now, endpoint, str(item_id), scope)
+        ))
+
+    def invalidate(self, endpoint: str, item_id: Optional[Hashable] = None, scope: Optional[str] = None) -> None:
+        """
+        Drop entries for an endpoint, optionally narrowed to one id and/or scope
+
+        Args:
+            endpoint (str): Endpoint whose entries should be dropped
+            item_id (Hashable, optional): Only drop entries for this id
+            scope (str, optional): Only drop entries for this user scope
+        """
+        query = "DELETE FROM entries WHERE endpoint = ?"
+        params = [endpoint]
+        if item_id is not None:
+            query += " AND item_id = ?"
+            params.append(str(item_id))
+        if scope is not None:
+            query += " AND scope = ?"
+            params.append(scope)
+
+        # Queued behind pending stores so none of them can bring the entry
+        # back. The caller does not wait for it: until it has run, the
+        # tombstone hides the entries from this process's reads.
+        tombstone = (endpoint, None if item_id is None else str(item_id), scope)
+        invalidated_at = time.time()
+        with self._tombstones_lock:
+            self._tombstones[tombstone] = invalidated_at
+
+        def write(connection: sqlite3.Connection) -> None:
+            connection.execute(query, params)
+            # A failed delete leaves the tombstone in place
+            with self._tombstones_lock:
+                if self._tombstones.get(tombstone) == invalidated_at:
+                    del self._tombstones[tombstone]
+
+        try:
+            self._writes.put_nowait(write)
+        except queue.Full:
+            # The tombstone is kept, so this process still never serves the entries
+            self.errors += 1
+            logger.warning("Disk cache invalidation of %s skipped: writer is backed up", endpoint)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete least recently used entries until under budget; runs inside the write transaction"""
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        freed = 0
+        victims = []
+        for endpoint, item_id, scope, size in connection.execute(
+            "SELECT endpoint, item_id, scope, size FROM entries ORDER BY accessed_at"
+        ):
+            victims.append((endpoint, item_id, scope))
+            freed += size
+            if total - freed <= self.max_bytes:
+                break
+        connection.executemany("DELETE FROM entries WHERE endpoint = ? AND item_id = ? AND scope = ?", victims)
+        self.evictions += len(victims)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report cache counters for this process and the shared database size
+
+        Returns:
+            Dict[str, int]: Hits, misses, evictions, errors, dropped writes, entries and bytes
+        """
+        try:
+            entries, size = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        except sqlite3.Error:
+            entries, size = 0, 0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "dropped_writes": self.dropped_writes,
+            "entries": entries,
+            "bytes": size
+        }
+
+
+@st.cache_resource
+def get_disk_cache() -> Optional[DiskCache]:
+    """Return the process-wide disk cache, or None if DISK_CACHE_DIR is not set"""
+    if not DISK_CACHE_DIR:
+        return None
+    try:
+        cache = DiskCache(DISK_CACHE_DIR)
+    except (OSError, sqlite3.Error) as e:
+        logger.error("Disk cache disabled: %s", str(e))
+        return None
+    get_metrics().register_source("disk_cache", lambda: stats_families("disk_cache", "Disk cache", cache.stats()))
+    return cache
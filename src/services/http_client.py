@@ -0,0 +1,384 @@
+import asyncio
+import os
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+import aiohttp
+import streamlit as st
+from src.services.resilience import (
+    HTTP_MAX_RETRIES,
+    IDEMPOTENT_METHODS,
+    RETRYABLE_STATUSES,
+    CircuitBreaker,
+    CircuitOpenError,
+    backoff_delay,
+    endpoint_timeout
+)
+from src.services.response_cache import token_scope
+from src.services.single_flight import SingleFlight
+from src.utils.custom_logger import CustomLogger
+from src.utils.fast_json import loads
+from src.utils.metrics import MetricFamily, MetricsRegistry, get_metrics
+
+try:
+    import brotli
+except ImportError:  # Brotli responses are only requested when a decoder is installed
+    brotli = None
+
+logger = CustomLogger("HttpClient")
+
+DEFAULT_BASE_URL = "http://localhost:8000"
+
+# Connection pool sizing, overridable per deployment
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "100"))
+HTTP_POOL_SIZE_PER_HOST = int(os.getenv("HTTP_POOL_SIZE_PER_HOST", "0"))
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+
+def decode_body(content: bytes, encoding: Optional[str]) -> bytes:
+    """
+    Undo a response's Content-Encoding
+
+    Args:
+        content (bytes): Body as received on the wire
+        encoding (str, optional): Value of the Content-Encoding header
+
+    Returns:
+        bytes: Decoded body
+    """
+    encoding = (encoding or "").strip().lower()
+    if not content or encoding in ("", "identity"):
+        return content
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompress(content, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(content)
+        except zlib.error:
+            # Some servers send raw deflate without the zlib header
+            return zlib.decompress(content, -zlib.MAX_WBITS)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(content)
+    raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+
+
+class HttpResponse:
+    """Buffered HTTP response exposing the subset of the requests API the listeners use"""
+
+    def __init__(
+        self,
+        status_code: int,
+        content: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        attempts: int = 1,
+        wire_bytes: Optional[int] = None
+    ):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.attempts = attempts
+        self.wire_bytes = len(content) if wire_bytes is None else wire_bytes
+
+    def header(self, name: str) -> Optional[str]:
+        """Look up a response header case-insensitively"""
+        name = name.lower()
+        for key, value in self.headers.items():
+            if key.lower() == name:
+                return value
+        return None
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return loads(self.content)
+
+
+class AsyncHttpClient:
+    """
+    Non-blocking HTTP client shared by the service listeners.
+
+    The underlying aiohttp session keeps a pool of keep-alive connections and
+    carries no credentials; callers pass their Authorization header with each
+    request. The session is created lazily on the event loop that first uses
+    it, and must only be used from that loop afterwards.
+
+    Every request gets connect/read timeouts for its route, idempotent
+    requests are retried with jittered backoff, and a circuit breaker fails
+    calls fast while the backend is unhealthy. Identical concurrent GETs made
+    with the same credentials share a single backend call. Compressed
+    responses are requested and decoded here, so the bytes actually
+    transferred can be measured.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        pool_size: int = HTTP_POOL_SIZE,
+        pool_size_per_host: int = HTTP_POOL_SIZE_PER_HOST,
+        keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT,
+        max_retries: int = HTTP_MAX_RETRIES,
+        metrics: Optional[MetricsRegistry] = None
+    ):
+        """
+        Initialize the HTTP client
+
+        Args:
+            base_url (str): Base URL of the backend service
+            pool_size (int): Maximum number of open connections (0 for no limit)
+            pool_size_per_host (int): Maximum connections per host (0 for no limit)
+            keepalive_timeout (float): Seconds an idle connection is kept open
+            max_retries (int): Retries for idempotent requests that fail transiently
+            metrics (MetricsRegistry, optional): Registry receiving per-route call metrics
+        """
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.pool_size_per_host = pool_size_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.max_retries = max_retries
+        self.breaker = CircuitBreaker(self.base_url)
+        self.single_flight = SingleFlight()
+        self.metrics = metrics or get_metrics()
+        self.metrics.register_source(f"http_client:{self.base_url}", self._metric_families)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        logger.info(f"AsyncHttpClient initialized with base URL: {self.base_url} (pool size: {pool_size})")
+
+    def url(self, path: str) -> str:
+        """Build an absolute URL for an endpoint path"""
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the aiohttp session, creating it on the current loop if needed"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            # Counts request body bytes as they are written, for metrics
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_chunk_sent.append(self._on_request_chunk_sent)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                trace_configs=[trace_config],
+                headers={"Accept-Encoding": ACCEPT_ENCODING},
+                # Bodies are decoded in _send_with_retries to measure wire size
+                auto_decompress=False
+            )
+            self._loop = asyncio.get_running_loop()
+        return self._session
+
+    @staticmethod
+    async def _on_request_chunk_sent(session, trace_config_ctx, params) -> None:
+        trace = trace_config_ctx.trace_request_ctx
+        if isinstance(trace, dict):
+            trace["sent"] += len(params.chunk)
+
+    @staticmethod
+    def _clean_params(params: Optional[Dict]) -> Optional[Dict]:
+        """Drop ``None`` values and stringify booleans, matching requests' behaviour"""
+        if not params:
+            return params
+        cleaned = {}
+        for key, value in params.items():
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                value = str(value).lower()
+            cleaned[key] = value
+        return cleaned
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        route: Optional[str] = None,
+        params: Optional[Dict] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> HttpResponse:
+        """
+        Send a request and buffer the response body
+
+        Args:
+            method (str): HTTP method
+            path (str): Endpoint path or absolute URL
+            route (str, optional): Route template used to pick timeouts, e.g. "/job/jobs/{job_id}"
+            params (Dict, optional): Query string parameters
+            json (Any, optional): JSON body
+            data (Any, optional): Form or multipart body
+            headers (Dict, optional): Extra request headers
+
+        Returns:
+            HttpResponse: Buffered response
+
+        Raises:
+            CircuitOpenError: If the circuit breaker rejects the call
+            aiohttp.ClientError: If the request keeps failing at the connection level
+            asyncio.TimeoutError: If the request keeps timing out
+        """
+        method = method.upper()
+        url = self.url(path)
+        params = self._clean_params(params)
+
+        def send():
+            return self._send(method, url, route, params, json, data, headers)
+
+        if method != "GET" or json is not None or data is not None:
+            return await send()
+
+        # The caller's credentials are part of the key, so a response is only
+        # ever shared between requests made on behalf of the same user
+        authorization = (headers or {}).get("Authorization")
+        key = (
+            method,
+            url,
+            tuple(sorted((params or {}).items())),
+            token_scope(authorization),
+            tuple(sorted((k, v) for k, v in (headers or {}).items() if k != "Authorization"))
+        )
+        return await self.single_flight.do(key, send)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        route: Optional[str],
+        params: Optional[Dict],
+        json: Optional[Any],
+        data: Optional[Any],
+        headers: Optional[Dict[str, str]]
+    ) -> HttpResponse:
+        """Send one request and record its latency, status, sizes and retries"""
+        trace = {"sent": 0, "attempts": 0}
+        label = route or urlsplit(url).path
+        started = time.monotonic()
+        try:
+            result = await self._send_with_retries(method, url, route, params, json, data, headers, trace)
+        except BaseException as e:
+            status = "circuit_open" if isinstance(e, CircuitOpenError) else type(e).__name__
+            self.metrics.record_request(
+                method, label, status, time.monotonic() - started,
+                request_bytes=trace["sent"], retries=max(0, trace["attempts"] - 1)
+            )
+            raise
+        self.metrics.record_request(
+            method, label, str(result.status_code), time.monotonic() - started,
+            request_bytes=trace["sent"], response_bytes=result.wire_bytes, retries=result.attempts - 1
+        )
+        self.metrics.record_saved(method, label, "compression", len(result.content) - result.wire_bytes)
+        return result
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        route: Optional[str],
+        params: Optional[Dict],
+        json: Optional[Any],
+        data: Optional[Any],
+        headers: Optional[Dict[str, str]],
+        trace: Dict[str, int]
+    ) -> HttpResponse:
+        """Send one request, applying timeouts, retries and the circuit breaker"""
+        session = await self._get_session()
+        connect_timeout, read_timeout = endpoint_timeout(route)
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+        retries = self.max_retries if method in IDEMPOTENT_METHODS else 0
+        attempt = 0
+
+        while True:
+            attempt += 1
+            trace["attempts"] = attempt
+            self.breaker.before_request()
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    data=data,
+                    headers=headers,
+                    timeout=timeout,
+                    trace_request_ctx=trace
+                ) as response:
+                    raw = await response.read()
+                    content = decode_body(raw, response.headers.get("Content-Encoding"))
+                    result = HttpResponse(response.status, content, dict(response.headers), attempt, len(raw))
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.breaker.record_failure()
+                if attempt > retries:
+                    raise
+                reason = type(e).__name__
+            except BaseException:
+                self.breaker.release()
+                raise
+            else:
+                # Only gateway errors mean the backend is unreachable or
+                # overloaded; any other status, including a 500 from a bad
+                # request, shows it is up and answering
+                if result.status_code not in RETRYABLE_STATUSES:
+                    self.breaker.record_success()
+                    return result
+                self.breaker.record_failure()
+                if attempt > retries:
+                    return result
+                reason = f"HTTP {result.status_code}"
+
+            delay = backoff_delay(attempt)
+            logger.warning(
+                f"{method} {route or url} failed ({reason}), retry {attempt}/{retries} in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+
+    def _metric_families(self) -> List[MetricFamily]:
+        """Expose circuit breaker and request coalescing state to the metrics registry"""
+        labels = {"backend": self.base_url}
+        breaker = self.breaker.stats()
+        flights = self.single_flight.stats()
+        states = {CircuitBreaker.CLOSED: 0, CircuitBreaker.HALF_OPEN: 1, CircuitBreaker.OPEN: 2}
+        return [
+            ("backend_circuit_state", "Circuit breaker state (0 closed, 1 half-open, 2 open)", "gauge",
+             [(labels, states[breaker["state"]])]),
+            ("backend_circuit_opened_total", "Times the circuit breaker opened", "counter",
+             [(labels, breaker["times_opened"])]),
+            ("backend_circuit_rejected_total", "Calls rejected while the circuit was open", "counter",
+             [(labels, breaker["rejected"])]),
+            ("backend_coalesced_requests_total", "GETs that joined an identical in-flight call", "counter",
+             [(labels, flights["coalesced"])])
+        ]
+
+    async def get(self, path: str, **kwargs) -> HttpResponse:
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> HttpResponse:
+        return await self.request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs) -> HttpResponse:
+        return await self.request("PUT", path, **kwargs)
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+@st.cache_resource
+def get_http_client(base_url: str = DEFAULT_BASE_URL) -> AsyncHttpClient:
+    """
+    Return the process-wide HTTP client for a backend URL
+
+    One client (and so one connection pool) is shared by every Streamlit
+    session; its requests run on the shared runner's loop.
+    """
+    return AsyncHttpClient(base_url)
@@ -1,21 +1,50 @@
-import requests
-from typing import Dict, Optional
+import asyncio
+import os
+import time
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set
+from src.services.conditional_get import cached_get_json
+from src.services.http_client import AsyncHttpClient, get_http_client
+from src.services.ranking_cache import RANKING_ENDPOINT, RankingCache, get_ranking_cache
+from src.services.records import Candidate, candidate_records, rank_entries
+from src.services.response_cache import ResponseCache, get_response_cache, principal_scope
 from src.utils.custom_logger import CustomLogger
 
 logger = CustomLogger("JobListener")
 
+JOB_ENDPOINT = "/job/jobs"
+# Candidates requested per page of search results
+SEARCH_PAGE_SIZE = int(os.getenv("SEARCH_PAGE_SIZE", "50"))
+# Maximum ranking requests in flight when ranking several jobs at once
+MULTI_RANK_CONCURRENCY = int(os.getenv("MULTI_RANK_CONCURRENCY", "6"))
+# Maximum job lookups in flight for a batch lookup
+JOB_BATCH_CONCURRENCY = int(os.getenv("JOB_BATCH_CONCURRENCY", "8"))
+
 class JobListener:
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        client: Optional[AsyncHttpClient] = None,
+        cache: Optional[ResponseCache] = None,
+        ranking_cache: Optional[RankingCache] = None
+    ):
         """Initialize the job service listener"""
         self.base_url = base_url
-        self.headers = {
-            "Content-Type": "application/json"
-        }
+        self.client = client or get_http_client(base_url)
+        self.cache = cache or get_response_cache()
+        self.ranking_cache = ranking_cache or get_ranking_cache()
+        self.token: Optional[str] = None
         logger.info("JobListener initialized")
 
     def update_token(self, token: str) -> None:
-        """Update authorization header with token"""
-        self.headers["Authorization"] = f"Bearer {token}"
+        """Update the token attached to each request"""
+        self.token = token
+
+    def _headers(self) -> Dict[str, str]:
+        """Build per-request headers with the bearer token if one is set"""
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
 
     async def create_job(self, job_data: Dict) -> Dict:
         """
@@ -31,13 +60,14 @@ class JobListener:
             endpoint = f"{self.base_url}/job/create_job"
             
             logger.info(f"Creating new job: {job_data.get('title', 'N/A')}")
-            response = requests.post(endpoint, json=job_data, headers=self.headers)
+            response = await self.client.post(endpoint, route="/job/create_job", json=job_data, headers=self._headers())
             
             if response.status_code == 200:
                 logger.info("Job created successfully")
+                self.cache.invalidate(JOB_ENDPOINT)
                 return response.json()
             else:
-                logger.error(f"Job creation failed: {response.text}")
+                logger.error("Job creation failed: %s", response.text)
                 return {"error": response.text}
                 
         except Exception as e:
@@ -46,42 +76,219 @@ class JobListener:
 
     async def get_job(self, job_id: str) -> Dict:
         """Get job details by ID"""
+        return await self._get_job(job_id)
+
+    async def _get_job(self, job_id: str, lookup_fresh: bool = True) -> Dict:
+        """Get job details by ID, optionally skipping the fresh-cache lookup the caller already made"""
         try:
-            endpoint = f"{self.base_url}/job/jobs/{job_id}"
-            
-            logger.info(f"Fetching job details for ID: {job_id}")
-            response = requests.get(endpoint, headers=self.headers)
-            
-            if response.status_code == 200:
-                logger.info("Job details retrieved successfully")
-                return response.json()
+            endpoint = f"{self.base_url}{JOB_ENDPOINT}/{job_id}"
+            cache_key = (JOB_ENDPOINT, str(job_id), principal_scope(self.token))
+
+            fetch = await cached_get_json(
+                self.client, self.cache, cache_key, endpoint,
+                route=f"{JOB_ENDPOINT}/{{job_id}}", headers=self._headers(), lookup_fresh=lookup_fresh
+            )
+            if fetch.source == "cache":
+                logger.info(f"Serving cached job details for ID: {job_id}")
+                return fetch.value
+            if fetch.value is not None:
+                logger.info("Job details retrieved successfully (%s)", fetch.source)
+                return fetch.value
             else:
-                logger.error(f"Job retrieval failed: {response.text}")
-                return {"error": response.text}
+                logger.error("Job retrieval failed: %s", fetch.response.text)
+                return {"error": fetch.response.text}
                 
         except Exception as e:
             logger.error(f"Job retrieval error: {str(e)}")
             return {"error": str(e)}
 
-    async def search_candidates(self, search_params: Dict) -> Dict:
-        """Search candidates based on criteria"""
+    async def get_jobs(self, job_ids: List[str], concurrency: int = JOB_BATCH_CONCURRENCY) -> Dict:
+        """
+        Get several jobs, fetching only the ones not already cached
+
+        Args:
+            job_ids (List[str]): Job IDs; duplicates are fetched once
+            concurrency (int): Maximum lookups in flight
+
+        Returns:
+            Dict: ``jobs`` with one entry per input ID in input order (job
+            details, or ``{"error": ...}``), ``failed`` listing the IDs that
+            could not be fetched with their errors, and ``cached``/``fetched``
+            counts
+        """
+        scope = principal_scope(self.token)
+        unique_ids = list(dict.fromkeys(str(job_id) for job_id in job_ids))
+        found: Dict[str, Dict] = {}
+        for job_id in unique_ids:
+            cached = self.cache.get((JOB_ENDPOINT, job_id, scope))
+            if cached is not None:
+                found[job_id] = cached
+        missing = [job_id for job_id in unique_ids if job_id not in found]
+        logger.info(f"Looking up {len(unique_ids)} jobs ({len(found)} cached, {len(missing)} to fetch)")
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(job_id: str) -> None:
+            async with semaphore:
+                # Already missed in the cache above; do not probe (and count) it again
+                found[job_id] = await self._get_job(job_id, lookup_fresh=False)
+
+        await asyncio.gather(*(fetch(job_id) for job_id in missing))
+        jobs = [found[str(job_id)] for job_id in job_ids]
+        failed = [
+            {"job_id": job_id, "error": found[job_id]["error"]}
+            for job_id in unique_ids
+            if isinstance(found[job_id], dict) and "error" in found[job_id]
+        ]
+        if failed:
+            logger.error("Batch job lookup failed for %s of %s jobs", len(failed), len(unique_ids))
+        return {
+            "jobs": jobs,
+            "failed": failed,
+            "cached": len(unique_ids) - len(missing),
+            "fetched": len(missing) - len(failed)
+        }
+
+    async def search_candidates(
+        self,
+        search_params: Dict,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Dict:
+        """
+        Search candidates based on criteria
+
+        Args:
+            search_params (Dict): Search filters (skills, experience, location)
+            limit (int, optional): Maximum candidates to return in this page
+            offset (int, optional): Number of matching candidates to skip
+            cursor (str, optional): Opaque cursor returned with the previous page
+
+        Returns:
+            Dict: Backend response, a candidate list or a page object
+        """
         try:
             endpoint = f"{self.base_url}/candidate/search"
+            params = dict(search_params)
+            for name, value in (("limit", limit), ("offset", offset), ("cursor", cursor)):
+                if value is not None:
+                    params[name] = value
             
-            logger.info(f"Searching candidates with params: {search_params}")
-            response = requests.get(endpoint, params=search_params, headers=self.headers)
+            logger.info("Searching candidates with params: %s", params)
+            response = await self.client.get(endpoint, route="/candidate/search", params=params, headers=self._headers())
             
             if response.status_code == 200:
                 logger.info("Candidate search completed successfully")
                 return response.json()
             else:
-                logger.error(f"Candidate search failed: {response.text}")
+                logger.error("Candidate search failed: %s", response.text)
                 return {"error": response.text}
                 
         except Exception as e:
             logger.error(f"Candidate search error: {str(e)}")
             return {"error": str(e)}
 
+    async def search_candidates_page(
+        self,
+        search_params: Dict,
+        page_size: int = SEARCH_PAGE_SIZE,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        keep_raw_text: bool = False,
+        seen_ids: Optional[Set] = None
+    ) -> Dict:
+        """
+        Fetch one page of search results as candidate records
+
+        Works with a backend that answers with a plain list (paged by
+        ``limit``/``offset``) as well as one answering with
+        ``{"candidates": [...], "next_cursor": ..., "total": ...}``. A backend
+        that ignores the paging parameters and returns more than ``page_size``
+        candidates is treated as having returned everything, and so is one
+        whose page holds no candidate from outside ``seen_ids`` (it ignored
+        ``offset`` and sent the first page again).
+
+        Args:
+            search_params (Dict): Search filters
+            page_size (int): Candidates requested per page
+            offset (int): Candidates already fetched
+            cursor (str, optional): Cursor returned with the previous page
+            keep_raw_text (bool): Keep each resume's extracted text on its record
+            seen_ids (Set, optional): Ids of the candidates already fetched;
+                these are left out of the returned page
+
+        Returns:
+            Dict: ``candidates``, ``next_offset``, ``next_cursor``, ``has_more``
+            and ``total`` (None if unknown), or ``{"error": ...}``
+        """
+        result = await self.search_candidates(
+            search_params, limit=page_size, offset=None if cursor else offset, cursor=cursor
+        )
+        if isinstance(result, dict) and "error" in result:
+            return result
+
+        if isinstance(result, dict):
+            candidates = result.get("candidates", [])
+            next_cursor = result.get("next_cursor")
+            total = result.get("total")
+        else:
+            candidates, next_cursor, total = result, None, None
+        next_offset = offset + len(candidates)
+
+        if len(candidates) > page_size:
+            has_more = False
+        elif next_cursor:
+            has_more = True
+        elif isinstance(total, int):
+            has_more = next_offset < total
+        else:
+            has_more = len(candidates) == page_size
+
+        records = candidate_records(candidates, keep_raw_text)
+        if seen_ids:
+            records = [record for record in records if record.id is None or record.id not in seen_ids]
+            if not records:
+                has_more = False
+        return {
+            "candidates": records,
+            "next_offset": next_offset,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+            "total": total
+        }
+
+    async def iter_candidate_pages(
+        self,
+        search_params: Dict,
+        page_size: int = SEARCH_PAGE_SIZE
+    ) -> AsyncIterator[List[Candidate]]:
+        """
+        Stream search results page by page, fetching each page on demand
+
+        Args:
+            search_params (Dict): Search filters
+            page_size (int): Candidates requested per page
+
+        Yields:
+            List[Candidate]: Candidates of the next page
+
+        Raises:
+            RuntimeError: If the backend fails part-way through
+        """
+        offset, cursor = 0, None
+        seen_ids = set()
+        while True:
+            page = await self.search_candidates_page(search_params, page_size, offset, cursor, seen_ids=seen_ids)
+            if "error" in page:
+                raise RuntimeError(f"Candidate search failed after {offset} candidates: {page['error']}")
+            if page["candidates"]:
+                seen_ids.update(candidate.id for candidate in page["candidates"])
+                yield page["candidates"]
+            if not page["has_more"] or not page["candidates"]:
+                return
+            offset, cursor = page["next_offset"], page["next_cursor"]
+
     async def rank_candidates(self, job_id: str) -> Dict:
         """Rank candidates for a specific job"""
         try:
@@ -89,31 +296,122 @@ class JobListener:
             params = {"job_id": job_id}
             
             logger.info(f"Ranking candidates for job ID: {job_id}")
-            response = requests.get(endpoint, params=params, headers=self.headers)
+            response = await self.client.get(endpoint, route="/candidate/rank_candidates", params=params, headers=self._headers())
             
             if response.status_code == 200:
                 logger.info("Candidates ranked successfully")
                 return response.json()
             else:
-                logger.error(f"Candidate ranking failed: {response.text}")
+                logger.error("Candidate ranking failed: %s", response.text)
                 return {"error": response.text}
                 
         except Exception as e:
             logger.error(f"Candidate ranking error: {str(e)}")
             return {"error": str(e)}
 
-    async def rank_candidates_with_params(self, params: dict) -> dict:
-        """Rank candidates for a specific job with extra params"""
+    async def rank_candidates_with_params(self, params: dict, refresh: bool = False) -> dict:
+        """
+        Rank candidates for a specific job with extra params
+
+        A query with only ``job_id``, ``min_score`` and ``limit`` is answered
+        from a fresh cached ranking of the same job when that ranking covers
+        it; ``refresh`` discards the cached ranking and asks the backend again.
+        """
         try:
-            endpoint = f"{self.base_url}/candidate/rank_candidates"
-            logger.info(f"Ranking candidates for job ID: {params.get('job_id')} with params: {params}")
-            response = requests.get(endpoint, params=params, headers=self.headers)
+            endpoint = f"{self.base_url}{RANKING_ENDPOINT}"
+            job_id = params.get("job_id")
+            scope = principal_scope(self.token)
+            reusable = set(params) == {"job_id", "min_score", "limit"}
+            if refresh:
+                self.ranking_cache.invalidate(job_id, scope)
+            elif reusable:
+                cached = self.ranking_cache.lookup(job_id, scope, float(params["min_score"]), int(params["limit"]))
+                if cached is not None:
+                    logger.info(f"Serving ranking for job ID: {job_id} from cached results")
+                    return cached
+
+            # Revalidate an expired ranking of exactly this query instead of downloading it again
+            headers = self._headers()
+            stale = self.ranking_cache.stale(job_id, scope) if reusable and not refresh else None
+            if stale is not None and (stale.min_score, stale.limit) != (float(params["min_score"]), int(params["limit"])):
+                stale = None
+            if stale is not None:
+                headers.update(stale.conditional_headers())
+
+            logger.info("Ranking candidates for job ID: %s with params: %s", job_id, params)
+            response = await self.client.get(endpoint, route=RANKING_ENDPOINT, params=params, headers=headers)
+            if response.status_code == 304 and stale is not None:
+                logger.info(f"Ranking for job ID: {job_id} not modified, reusing cached results")
+                self.ranking_cache.revalidated(job_id, scope, stale)
+                self.client.metrics.record_saved("GET", RANKING_ENDPOINT, "not_modified", stale.size)
+                return stale.result
             if response.status_code == 200:
                 logger.info("Candidates ranked successfully")
-                return response.json()
+                result = response.json()
+                if reusable:
+                    self.ranking_cache.store(
+                        job_id, scope, result, float(params["min_score"]), int(params["limit"]),
+                        size=len(response.content),
+                        etag=response.header("ETag"),
+                        last_modified=response.header("Last-Modified")
+                    )
+                return result
             else:
-                logger.error(f"Candidate ranking failed: {response.text}")
+                logger.error("Candidate ranking failed: %s", response.text)
                 return {"error": response.text}
         except Exception as e:
             logger.error(f"Candidate ranking error: {str(e)}")
-            return {"error": str(e)}
\ No newline at end of file
+            return {"error": str(e)}
+
+    async def rank_jobs(
+        self,
+        job_ids: List[str],
+        min_score: float,
+        limit: int,
+        concurrency: int = MULTI_RANK_CONCURRENCY,
+        on_result: Optional[Callable[[Dict], None]] = None,
+        refresh: bool = False
+    ) -> Dict:
+        """
+        Rank candidates for several jobs concurrently
+
+        Args:
+            job_ids (List[str]): Jobs to rank
+            min_score (float): Minimum score passed with every ranking
+            limit (int): Maximum candidates per job
+            concurrency (int): Maximum rankings in flight
+            on_result (Callable, optional): Called with each job's status as it completes
+            refresh (bool): Bypass cached rankings
+
+        Returns:
+            Dict: Per-job statuses in input order plus totals and wall time
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        started = time.monotonic()
+        logger.info(f"Ranking candidates for {len(job_ids)} jobs")
+
+        async def rank_one(index: int, job_id: str) -> Dict:
+            async with semaphore:
+                job_started = time.monotonic()
+                params = {"job_id": job_id, "min_score": min_score, "limit": int(limit)}
+                result = await self.rank_candidates_with_params(params, refresh=refresh)
+                status = {"index": index, "job_id": job_id, "elapsed": time.monotonic() - job_started}
+                if isinstance(result, dict) and "error" in result:
+                    status["error"] = result["error"]
+                else:
+                    status["candidates"] = rank_entries(result)
+                if on_result:
+                    on_result(status)
+                return status
+
+        results = await asyncio.gather(*(rank_one(index, job_id) for index, job_id in enumerate(job_ids)))
+        elapsed = time.monotonic() - started
+        failed = sum(1 for status in results if "error" in status)
+        logger.info(f"Ranked {len(job_ids) - failed}/{len(job_ids)} jobs in {elapsed:.2f}s")
+        return {
+            "results": list(results),
+            "succeeded": len(job_ids) - failed,
+            "failed": failed,
+            "elapsed": elapsed,
+            "slowest": max((status["elapsed"] for status in results), default=0.0)
+        }
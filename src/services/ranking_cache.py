@@ -0,0 +1,276 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import streamlit as st
+from src.services.disk_cache import DiskCache, get_disk_cache
+from src.utils.custom_logger import CustomLogger
+from src.utils.metrics import get_metrics, stats_families
+
+logger = CustomLogger("RankingCache")
+
+RANKING_CACHE_TTL = float(os.getenv("RANKING_CACHE_TTL", "120"))
+RANKING_CACHE_MAX_JOBS = int(os.getenv("RANKING_CACHE_MAX_JOBS", "256"))
+RANKING_ENDPOINT = "/candidate/rank_candidates"
+
+# Fields checked, in order, on a candidate and then its match_scores for the
+# score the backend ranks and filters by
+RANK_SCORE_FIELDS = ("overall_score", "total_score", "final_score", "score")
+
+
+def candidate_score(candidate: Dict) -> Optional[float]:
+    """
+    Find the ranking score of a ranked candidate
+
+    Args:
+        candidate (Dict): Candidate entry from a ranking response
+
+    Returns:
+        float: The ranking score, or None if it cannot be determined
+    """
+    sources = [candidate, candidate.get("match_scores") or {}]
+    for source in sources:
+        for field in RANK_SCORE_FIELDS:
+            value = source.get(field)
+            if isinstance(value, (int, float)):
+                return float(value)
+    return None
+
+
+def ranking_candidates(result: Any) -> List[Dict]:
+    """Extract the candidate list from either shape of ranking response"""
+    if isinstance(result, list):
+        return result
+    if isinstance(result, dict):
+        return result.get("candidates", [])
+    return []
+
+
+def with_candidates(result: Any, candidates: List[Dict]) -> Any:
+    """Return a ranking response of the same shape holding other candidates"""
+    if isinstance(result, dict):
+        return {**result, "candidates": candidates}
+    return candidates
+
+
+class RankedList:
+    """A ranking fetched from the backend together with the query that produced it"""
+
+    def __init__(
+        self,
+        result: Any,
+        min_score: float,
+        limit: int,
+        age: float = 0.0,
+        size: int = 0,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        self.result = result
+        self.candidates = ranking_candidates(result)
+        self.min_score = min_score
+        self.limit = limit
+        self.fetched_at = time.monotonic() - age
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+        self.scores = [candidate_score(candidate) for candidate in self.candidates]
+        self.scored = all(score is not None for score in self.scores)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers asking the backend to answer 304 if this ranking is unchanged"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def answer(self, min_score: float, limit: int) -> Optional[Any]:
+        """
+        Answer a narrower query from this list
+
+        The list holds the top ``self.limit`` candidates scoring at least
+        ``self.min_score``, in rank order. A query with a higher threshold is a
+        filtered prefix of it; the answer is complete unless it would need more
+        candidates than the backend cut off at ``self.limit``.
+
+        Returns:
+            Any: Ranking response for the query, or None if more data is needed
+        """
+        if min_score < self.min_score or not self.scored:
+            return None
+        filtered = [
+            candidate for candidate, score in zip(self.candidates, self.scores)
+            if score >= min_score
+        ]
+        truncated_by_backend = len(self.candidates) >= self.limit
+        dropped_some = len(filtered) < len(self.candidates)
+        if len(filtered) < limit and truncated_by_backend and not dropped_some:
+            return None
+        return with_candidates(self.result, filtered[:limit])
+
+
+class RankingCache:
+    """
+    Keeps the latest ranked list per (job_id, user scope) so that queries with
+    a higher ``min_score`` or smaller ``limit`` are answered locally.
+
+    Expired lists are kept until evicted so a repeat of the same query can be
+    revalidated with the backend's validators. With a ``DiskCache`` attached,
+    ranked lists are also persisted and a memory miss falls back to a fresh
+    list on disk.
+    """
+
+    def __init__(
+        self,
+        ttl: float = RANKING_CACHE_TTL,
+        max_jobs: int = RANKING_CACHE_MAX_JOBS,
+        disk: Optional[DiskCache] = None
+    ):
+        """
+        Initialize the ranking cache
+
+        Args:
+            ttl (float): Seconds a ranked list may be reused before it is stale
+            max_jobs (int): Maximum number of ranked lists kept
+            disk (DiskCache, optional): Persistent tier shared across processes
+        """
+        self.ttl = ttl
+        self.max_jobs = max_jobs
+        self.disk = disk
+        self._lists: "OrderedDict[Tuple[str, str], RankedList]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        logger.info(f"RankingCache initialized (ttl: {ttl}s, max jobs: {max_jobs})")
+
+    def lookup(self, job_id: str, scope: str, min_score: float, limit: int) -> Optional[Any]:
+        """
+        Answer a ranking query from a fresh cached list if it covers the query
+
+        Returns:
+            Any: Ranking response, or None if the backend must be asked
+        """
+        key = (str(job_id), scope)
+        with self._lock:
+            ranked = self._lists.get(key)
+            if ranked is not None and time.monotonic() - ranked.fetched_at > self.ttl:
+                ranked = None
+            answer = ranked.answer(min_score, limit) if ranked is not None else None
+            if answer is not None:
+                self._lists.move_to_end(key)
+                self.hits += 1
+                return answer
+
+        if ranked is None and self.disk is not None:
+            ranked = self._load(job_id, scope)
+            answer = ranked.answer(min_score, limit) if ranked is not None else None
+            if answer is not None:
+                with self._lock:
+                    self._remember(key, ranked)
+                    self.hits += 1
+                return answer
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _load(self, job_id: str, scope: str, fresh_only: bool = True) -> Optional[RankedList]:
+        """Read a ranked list persisted by this or another process"""
+        stored = self.disk.get((RANKING_ENDPOINT, str(job_id), scope))
+        if stored is None or (fresh_only and (not stored.fresh or stored.age > self.ttl)):
+            return None
+        value = stored.value
+        return RankedList(
+            value["result"], value["min_score"], value["limit"],
+            age=stored.age, size=stored.size, etag=stored.etag, last_modified=stored.last_modified
+        )
+
+    def stale(self, job_id: str, scope: str) -> Optional[RankedList]:
+        """
+        Find the latest ranked list for a job, fresh or not, if it can be revalidated
+
+        Returns:
+            RankedList: A list carrying ``ETag``/``Last-Modified`` validators, or None
+        """
+        with self._lock:
+            ranked = self._lists.get((str(job_id), scope))
+        if ranked is None and self.disk is not None:
+            ranked = self._load(job_id, scope, fresh_only=False)
+        if ranked is None or not (ranked.etag or ranked.last_modified):
+            return None
+        return ranked
+
+    def revalidated(self, job_id: str, scope: str, ranked: RankedList) -> None:
+        """Mark a ranked list fresh again after the backend answered 304 Not Modified"""
+        ranked.fetched_at = time.monotonic()
+        with self._lock:
+            self._remember((str(job_id), scope), ranked)
+        if self.disk is not None:
+            self.disk.touch((RANKING_ENDPOINT, str(job_id), scope), self.ttl)
+
+    def _remember(self, key: Tuple[str, str], ranked: RankedList) -> None:
+        """Keep a ranked list in memory; the caller must hold the lock"""
+        self._lists[key] = ranked
+        self._lists.move_to_end(key)
+        while len(self._lists) > self.max_jobs:
+            self._lists.popitem(last=False)
+
+    def store(
+        self,
+        job_id: str,
+        scope: str,
+        result: Any,
+        min_score: float,
+        limit: int,
+        size: int = 0,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """
+        Remember a backend ranking unless a cached list already covers more
+        """
+        key = (str(job_id), scope)
+        ranked = RankedList(result, min_score, limit, size=size, etag=etag, last_modified=last_modified)
+        with self._lock:
+            current = self._lists.get(key)
+            if (
+                current is not None
+                and time.monotonic() - current.fetched_at <= self.ttl
+                and current.min_score <= min_score
+                and current.limit >= limit
+            ):
+                return
+            self._remember(key, ranked)
+        if self.disk is not None:
+            self.disk.set(
+                (RANKING_ENDPOINT, str(job_id), scope),
+                {"result": result, "min_score": min_score, "limit": limit},
+                etag=etag,
+                last_modified=last_modified,
+                ttl=self.ttl
+            )
+
+    def invalidate(self, job_id: Optional[str] = None, scope: Optional[str] = None) -> None:
+        """Drop cached rankings for a job (or all jobs), optionally for one scope"""
+        with self._lock:
+            for key in list(self._lists):
+                if (job_id is None or key[0] == str(job_id)) and (scope is None or key[1] == scope):
+                    del self._lists[key]
+        if self.disk is not None:
+            self.disk.invalidate(RANKING_ENDPOINT, None if job_id is None else str(job_id), scope)
+
+    def stats(self) -> Dict[str, int]:
+        """Report hit/miss counters and the number of cached rankings"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "jobs": len(self._lists)}
+
+
+@st.cache_resource
+def get_ranking_cache() -> RankingCache:
+    """Return the process-wide ranking cache"""
+    cache = RankingCache(disk=get_disk_cache())
+    get_metrics().register_source("ranking_cache", lambda: stats_families("ranking_cache", "Ranking cache", cache.stats()))
+    return cache
@@ -0,0 +1,270 @@
+import hashlib
+import sys
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from src.services.ranking_cache import candidate_score, ranking_candidates
+from src.utils.fast_json import dumps
+
+_NO_SCORES: Mapping[str, Any] = {}
+
+
+def _text(value: Any) -> Optional[str]:
+    """Interned string form of a short repeated value such as a skill or company"""
+    if value is None:
+        return None
+    return sys.intern(str(value))
+
+
+def _texts(values: Optional[Iterable]) -> Tuple[str, ...]:
+    return tuple(_text(value) for value in values or () if value)
+
+
+class Experience:
+    """One position on a parsed resume"""
+
+    __slots__ = ("title", "company", "period", "responsibilities")
+
+    def __init__(self, title: Optional[str], company: Optional[str], period: Optional[str], responsibilities: Tuple[str, ...]):
+        self.title = title
+        self.company = company
+        self.period = period
+        self.responsibilities = responsibilities
+
+    @classmethod
+    def from_payload(cls, payload: Dict) -> "Experience":
+        return cls(
+            _text(payload.get("title")),
+            _text(payload.get("company")),
+            payload.get("period"),
+            tuple(str(item) for item in payload.get("responsibilities") or ())
+        )
+
+
+class Education:
+    """One degree on a parsed resume"""
+
+    __slots__ = ("degree", "institution", "period")
+
+    def __init__(self, degree: Optional[str], institution: Optional[str], period: Optional[str]):
+        self.degree = degree
+        self.institution = institution
+        self.period = period
+
+    @classmethod
+    def from_payload(cls, payload: Dict) -> "Education":
+        return cls(_text(payload.get("degree")), _text(payload.get("institution")), payload.get("period"))
+
+
+class ParsedResume:
+    """The structured part of a resume as extracted by the backend"""
+
+    __slots__ = (
+        "personal_info", "experience", "education", "technical_skills", "soft_skills", "certifications", "languages"
+    )
+
+    def __init__(
+        self,
+        personal_info: Dict[str, Any],
+        experience: Tuple[Experience, ...],
+        education: Tuple[Education, ...],
+        technical_skills: Tuple[str, ...],
+        soft_skills: Tuple[str, ...],
+        certifications: Tuple[str, ...],
+        languages: Tuple[str, ...]
+    ):
+        self.personal_info = personal_info
+        self.experience = experience
+        self.education = education
+        self.technical_skills = technical_skills
+        self.soft_skills = soft_skills
+        self.certifications = certifications
+        self.languages = languages
+
+    @classmethod
+    def from_payload(cls, payload: Optional[Dict]) -> "ParsedResume":
+        payload = payload or {}
+        skills = payload.get("skills") or {}
+        return cls(
+            {key: value for key, value in (payload.get("personal_info") or {}).items() if value},
+            tuple(Experience.from_payload(item) for item in payload.get("experience") or () if isinstance(item, dict)),
+            tuple(Education.from_payload(item) for item in payload.get("education") or () if isinstance(item, dict)),
+            _texts(skills.get("technical")),
+            _texts(skills.get("soft")),
+            _texts(payload.get("certifications")),
+            _texts(payload.get("languages"))
+        )
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.personal_info.get("name")
+
+    @property
+    def email(self) -> Optional[str]:
+        return self.personal_info.get("email")
+
+    @property
+    def location(self) -> Optional[str]:
+        return self.personal_info.get("location")
+
+
+class Candidate:
+    """
+    A candidate from a search or resume response.
+
+    ``raw_text`` is only kept when asked for at decode time; result lists
+    never show it. ``digest`` identifies the rendered content so unchanged
+    candidates can be served from the render cache.
+    """
+
+    __slots__ = ("id", "parsed_resume", "total_experience", "location", "raw_text", "digest")
+
+    def __init__(
+        self,
+        candidate_id: Any,
+        parsed_resume: ParsedResume,
+        total_experience: Optional[float],
+        location: Optional[str],
+        raw_text: Optional[str],
+        digest: str
+    ):
+        self.id = candidate_id
+        self.parsed_resume = parsed_resume
+        self.total_experience = total_experience
+        self.location = location
+        self.raw_text = raw_text
+        self.digest = digest
+
+    # Unranked candidates have no scores; RankEntry stores them in slots
+    @property
+    def match_scores(self) -> Mapping[str, Any]:
+        return _NO_SCORES
+
+    @property
+    def score(self) -> Optional[float]:
+        return None
+
+    @staticmethod
+    def _fields(payload: Dict, keep_raw_text: bool) -> Tuple:
+        """Decode the fields shared by every candidate record"""
+        rendered = {key: value for key, value in payload.items() if key != "raw_text"}
+        parsed_resume = ParsedResume.from_payload(payload.get("parsed_resume"))
+        return (
+            payload.get("id"),
+            parsed_resume,
+            payload.get("total_experience"),
+            parsed_resume.location or _text(payload.get("location")),
+            payload.get("raw_text") if keep_raw_text else None,
+            hashlib.sha1(dumps(rendered, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        )
+
+    @classmethod
+    def from_payload(cls, payload: Dict, keep_raw_text: bool = False) -> "Candidate":
+        """
+        Decode a candidate payload
+
+        Args:
+            payload (Dict): Candidate entry from a search or resume response
+            keep_raw_text (bool): Keep the resume's extracted text
+
+        Returns:
+            Candidate: The decoded record
+        """
+        return cls(*cls._fields(payload, keep_raw_text))
+
+
+class RankEntry(Candidate):
+    """A candidate in a ranking, with its match scores and ranking score"""
+
+    __slots__ = ("match_scores", "score")
+
+    def __init__(self, *fields: Any, match_scores: Dict[str, Any], score: Optional[float]):
+        super().__init__(*fields)
+        self.match_scores = match_scores
+        self.score = score
+
+    @classmethod
+    def from_payload(cls, payload: Dict, keep_raw_text: bool = False) -> "RankEntry":
+        """
+        Decode a ranked candidate payload
+
+        Args:
+            payload (Dict): Candidate entry from a ranking response
+            keep_raw_text (bool): Keep the resume's extracted text
+
+        Returns:
+            RankEntry: The decoded record
+        """
+        return cls(
+            *cls._fields(payload, keep_raw_text),
+            match_scores=dict(payload.get("match_scores") or {}),
+            score=candidate_score(payload)
+        )
+
+
+class Job:
+    """A job posting; ``parsed_jd`` keeps the backend's free-form categories"""
+
+    __slots__ = (
+        "id", "title", "company", "location", "required_experience", "job_description",
+        "parsed_jd", "technical_skills", "soft_skills"
+    )
+
+    def __init__(
+        self,
+        job_id: Any,
+        title: Optional[str],
+        company: Optional[str],
+        location: Optional[str],
+        required_experience: Any,
+        job_description: Optional[str],
+        parsed_jd: Optional[Dict[str, Any]],
+        technical_skills: Tuple[str, ...],
+        soft_skills: Tuple[str, ...]
+    ):
+        self.id = job_id
+        self.title = title
+        self.company = company
+        self.location = location
+        self.required_experience = required_experience
+        self.job_description = job_description
+        self.parsed_jd = parsed_jd
+        self.technical_skills = technical_skills
+        self.soft_skills = soft_skills
+
+    @classmethod
+    def from_payload(cls, payload: Dict) -> "Job":
+        """
+        Decode a job payload
+
+        Args:
+            payload (Dict): Job details from the backend
+
+        Returns:
+            Job: The decoded record
+        """
+        parsed_jd = payload.get("parsed_jd")
+        skills = (parsed_jd.get("skills") if isinstance(parsed_jd, dict) else None) or {}
+        return cls(
+            payload.get("id") or payload.get("job_id"),
+            payload.get("title"),
+            _text(payload.get("company")),
+            _text(payload.get("location")),
+            payload.get("required_experience"),
+            payload.get("job_description"),
+            parsed_jd,
+            _texts(skills.get("technical")),
+            _texts(skills.get("soft"))
+        )
+
+
+def candidate_records(payloads: Iterable[Dict], keep_raw_text: bool = False) -> List[Candidate]:
+    """Decode search results, skipping anything that is not a candidate object"""
+    return [Candidate.from_payload(payload, keep_raw_text) for payload in payloads if isinstance(payload, dict)]
+
+
+def rank_entries(result: Any, keep_raw_text: bool = False) -> List[RankEntry]:
+    """Decode the candidates of either shape of ranking response, in rank order"""
+    return [
+        RankEntry.from_payload(payload, keep_raw_text)
+        for payload in ranking_candidates(result)
+        if isinstance(payload, dict)
+    ]
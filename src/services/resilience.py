@@ -0,0 +1,164 @@
+import os
+import random
+import time
+from typing import Dict, Optional, Tuple
+from src.utils.custom_logger import CustomLogger
+
+logger = CustomLogger("Resilience")
+
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+HTTP_BACKOFF_BASE = float(os.getenv("HTTP_BACKOFF_BASE", "0.25"))
+HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "4"))
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+
+# (connect, read) timeouts in seconds for routes that differ from the default
+ENDPOINT_TIMEOUTS: Dict[str, Tuple[float, float]] = {
+    "/auth/token": (HTTP_CONNECT_TIMEOUT, 10.0),
+    "/auth/register": (HTTP_CONNECT_TIMEOUT, 10.0),
+    "/job/jobs/{job_id}": (HTTP_CONNECT_TIMEOUT, 10.0),
+    "/candidate/resume": (HTTP_CONNECT_TIMEOUT, 15.0),
+    "/candidate/upload_resume": (HTTP_CONNECT_TIMEOUT, 120.0),
+    "/candidate/rank_candidates": (HTTP_CONNECT_TIMEOUT, 120.0),
+}
+
+# Methods that may be retried without risking a duplicate side effect
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Statuses that indicate the backend (or a proxy in front of it) is unhealthy
+RETRYABLE_STATUSES = frozenset({502, 503, 504})
+
+
+def endpoint_timeout(route: Optional[str]) -> Tuple[float, float]:
+    """
+    Look up the (connect, read) timeouts for a route
+
+    Args:
+        route (str, optional): Route template such as "/job/jobs/{job_id}"
+
+    Returns:
+        Tuple[float, float]: Connect and read timeouts in seconds
+    """
+    return ENDPOINT_TIMEOUTS.get(route or "", (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
+
+
+def backoff_delay(attempt: int, base: float = HTTP_BACKOFF_BASE, cap: float = HTTP_BACKOFF_MAX) -> float:
+    """
+    Full-jitter exponential backoff delay before retry number ``attempt``
+
+    Args:
+        attempt (int): Retry number, starting at 1
+        base (float): Delay scale in seconds
+        cap (float): Upper bound of the delay in seconds
+
+    Returns:
+        float: Seconds to sleep
+    """
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is rejected because the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Fails requests fast while the backend looks unhealthy.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects calls for ``reset_timeout`` seconds. It then lets a single trial
+    call through (half-open); success closes it again, failure re-opens it.
+    The breaker is used from the shared event loop only, so it needs no lock.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT
+    ):
+        """
+        Initialize the circuit breaker
+
+        Args:
+            name (str): Name used in log lines, usually the backend URL
+            failure_threshold (int): Consecutive failures that open the circuit
+            reset_timeout (float): Seconds to stay open before a trial call
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._trial_in_flight = False
+
+    def before_request(self) -> None:
+        """
+        Check whether a request may proceed
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a trial call is already running
+        """
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                raise CircuitOpenError(f"Backend {self.name} is unavailable (circuit open)")
+            self._transition(self.HALF_OPEN)
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                self.rejected += 1
+                raise CircuitOpenError(f"Backend {self.name} is recovering (circuit half-open)")
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        """Record a healthy response"""
+        self._trial_in_flight = False
+        self.consecutive_failures = 0
+        if self.state != self.CLOSED:
+            self._transition(self.CLOSED)
+
+    def release(self) -> None:
+        """Give up a call without judging backend health, freeing any trial slot"""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a connection error, timeout or gateway error status"""
+        self._trial_in_flight = False
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            if self.state != self.OPEN:
+                self.times_opened += 1
+                self._transition(self.OPEN)
+
+    def stats(self) -> Dict:
+        """
+        Report the breaker state and counters
+
+        Returns:
+            Dict: State, consecutive failures, times opened and rejected calls
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected
+        }
+
+    def _transition(self, state: str) -> None:
+        """Move to a new state and log the change"""
+        previous, self.state = self.state, state
+        message = f"Circuit breaker for {self.name}: {previous} -> {state}"
+        if state == self.OPEN:
+            logger.error(f"{message} after {self.consecutive_failures} consecutive failures")
+        else:
+            logger.warning(message)
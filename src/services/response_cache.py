@@ -0,0 +1,302 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple
+import streamlit as st
+from src.services.disk_cache import DiskCache, get_disk_cache
+from src.utils.custom_logger import CustomLogger
+from src.utils.metrics import get_metrics, stats_families
+
+logger = CustomLogger("ResponseCache")
+
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "300"))
+
+CacheKey = Tuple[str, Hashable, str]
+
+
+def token_scope(token: Optional[str]) -> str:
+    """
+    Derive a cache scope from a bearer token without keeping the token itself
+
+    Args:
+        token (str, optional): JWT token of the caller
+
+    Returns:
+        str: Short digest identifying the caller, or "anonymous"
+    """
+    if not token:
+        return "anonymous"
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def principal_scope(token: Optional[str]) -> str:
+    """
+    Derive a cache scope that stays the same across logins of the same user
+
+    Uses the subject of the JWT issued by the backend, so persisted entries
+    are still found after the user signs in again. The token is not
+    verified here; it only ever comes from the backend's login response.
+    Tokens without a readable subject fall back to ``token_scope``.
+
+    Args:
+        token (str, optional): JWT token of the caller
+
+    Returns:
+        str: Short digest identifying the user, or "anonymous"
+    """
+    if not token:
+        return "anonymous"
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        subject = claims.get("sub") if isinstance(claims, dict) else None
+    except (IndexError, ValueError):
+        subject = None
+    if not subject:
+        return token_scope(token)
+    return "user-" + hashlib.sha256(str(subject).encode("utf-8")).hexdigest()[:16]
+
+
+class StoredResponse(NamedTuple):
+    """A cached response that may be stale, with the validators to revalidate it"""
+    value: Any
+    size: int
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers asking the backend to answer 304 if the response is unchanged"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache for decoded backend responses.
+
+    Entries are keyed by (endpoint, id, user scope), expire after a per-entry
+    TTL, and are evicted least-recently-used first once either the entry or the
+    byte budget is exceeded. Cached values are shared, so callers must treat
+    them as read-only.
+
+    Expired entries that carry ``ETag``/``Last-Modified`` validators are kept
+    until evicted so they can be revalidated with a conditional request.
+    With a ``DiskCache`` attached, stored entries are also persisted and a
+    memory miss falls through to fresh entries on disk.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+        default_ttl: float = RESPONSE_CACHE_TTL,
+        disk: Optional[DiskCache] = None
+    ):
+        """
+        Initialize the response cache
+
+        Args:
+            max_entries (int): Maximum number of cached responses
+            max_bytes (int): Maximum total size of cached response bodies
+            default_ttl (float): Seconds an entry stays fresh unless overridden
+            disk (DiskCache, optional): Persistent tier shared across processes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.disk = disk
+        # key -> (value, size, expires_at, etag, last_modified)
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, int, float, Optional[str], Optional[str]]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        logger.info(f"ResponseCache initialized (max entries: {max_entries}, max bytes: {max_bytes})")
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Look up a fresh entry and mark it as recently used
+
+        Args:
+            key (CacheKey): (endpoint, id, scope) tuple
+
+        Returns:
+            Any: Cached value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, size, expires_at, etag, last_modified = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                if not (etag or last_modified):
+                    self._remove(key)
+                self.expirations += 1
+            self.misses += 1
+
+        if self.disk is not None:
+            stored = self.disk.get(key)
+            if stored is not None and stored.fresh:
+                ttl = min(self.default_ttl, stored.expires_at - time.time())
+                self._store(key, stored.value, stored.size, ttl, stored.etag, stored.last_modified)
+                return stored.value
+        return None
+
+    def get_stale(self, key: CacheKey) -> Optional[StoredResponse]:
+        """
+        Find a cached response that can be revalidated, fresh or not
+
+        Args:
+            key (CacheKey): (endpoint, id, scope) tuple
+
+        Returns:
+            StoredResponse: Value and validators, or None if nothing revalidatable is cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[3] or entry[4]):
+                value, size, _, etag, last_modified = entry
+                return StoredResponse(value, size, etag, last_modified)
+        if self.disk is not None:
+            stored = self.disk.get(key)
+            if stored is not None and (stored.etag or stored.last_modified):
+                return StoredResponse(stored.value, stored.size, stored.etag, stored.last_modified)
+        return None
+
+    def revalidated(self, key: CacheKey, stored: StoredResponse, ttl: Optional[float] = None) -> None:
+        """
+        Mark a response fresh again after the backend answered 304 Not Modified
+
+        Args:
+            key (CacheKey): (endpoint, id, scope) tuple
+            stored (StoredResponse): The entry that was revalidated
+            ttl (float, optional): Seconds the entry stays fresh
+        """
+        self._store(key, stored.value, stored.size, ttl, stored.etag, stored.last_modified)
+        if self.disk is not None:
+            self.disk.touch(key, ttl)
+
+    def set(
+        self,
+        key: CacheKey,
+        value: Any,
+        size: int,
+        ttl: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """
+        Store a value, evicting least-recently-used entries to stay within budget
+
+        Args:
+            key (CacheKey): (endpoint, id, scope) tuple
+            value (Any): Decoded response to cache
+            size (int): Approximate size of the value in bytes
+            ttl (float, optional): Seconds the entry stays fresh
+            etag (str, optional): ``ETag`` header of the response
+            last_modified (str, optional): ``Last-Modified`` header of the response
+        """
+        if self.disk is not None:
+            self.disk.set(key, value, etag=etag, last_modified=last_modified, ttl=ttl)
+        self._store(key, value, size, ttl, etag, last_modified)
+
+    def _store(
+        self,
+        key: CacheKey,
+        value: Any,
+        size: int,
+        ttl: Optional[float],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Store a value in memory only"""
+        if size > self.max_bytes:
+            logger.debug(f"Response for {key[0]} too large to cache ({size} bytes)")
+            return
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires_at, etag, last_modified)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, endpoint: str, item_id: Optional[Hashable] = None, scope: Optional[str] = None) -> int:
+        """
+        Drop entries for an endpoint, optionally narrowed to one id and/or scope
+
+        Args:
+            endpoint (str): Endpoint whose entries should be dropped
+            item_id (Hashable, optional): Only drop entries for this id
+            scope (str, optional): Only drop entries for this user scope
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            matches = [
+                key for key in self._entries
+                if key[0] == endpoint
+                and (item_id is None or key[1] == item_id)
+                and (scope is None or key[2] == scope)
+            ]
+            for key in matches:
+                self._remove(key)
+        if self.disk is not None:
+            self.disk.invalidate(endpoint, item_id, scope)
+        if matches:
+            logger.info(f"Invalidated {len(matches)} cached response(s) for {endpoint}")
+        return len(matches)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report cache counters
+
+        Returns:
+            Dict[str, int]: Hits, misses, evictions, expirations, entries and bytes
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._entries),
+                "bytes": self._bytes
+            }
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove an entry; the caller must hold the lock"""
+        size = self._entries.pop(key)[1]
+        self._bytes -= size
+
+
+@st.cache_resource
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache"""
+    cache = ResponseCache(disk=get_disk_cache())
+    get_metrics().register_source("response_cache", lambda: stats_families("response_cache", "Response cache", cache.stats()))
+    return cache
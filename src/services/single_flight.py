@@ -0,0 +1,54 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+from src.utils.custom_logger import CustomLogger
+
+logger = CustomLogger("SingleFlight")
+
+
+class SingleFlight:
+    """
+    Collapses identical concurrent calls into one.
+
+    While a call for a key is in flight, later callers with the same key await
+    the same task instead of starting their own. The key must include
+    everything that affects the result, including the caller's authorization
+    scope. Used from the shared event loop only.
+    """
+
+    def __init__(self):
+        """Initialize the single-flight group"""
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``fn`` for a key, or join the call already running for it
+
+        Args:
+            key (Hashable): Identity of the call
+            fn (Callable): Factory for the coroutine doing the actual work
+
+        Returns:
+            Any: Result shared by every caller with this key
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.coalesced += 1
+            logger.debug(f"Joining in-flight call for {key[1] if isinstance(key, tuple) and len(key) > 1 else key}")
+        # Shield so one caller giving up does not cancel the call for the others
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report how many calls were made and how many joined an in-flight call
+
+        Returns:
+            Dict[str, int]: Calls started, calls coalesced and calls in flight
+        """
+        return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": len(self._in_flight)}
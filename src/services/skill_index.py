@@ -0,0 +1,165 @@
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Optional, Set
+from src.services.records import Candidate
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_skill(skill: str) -> str:
+    """Lowercase a skill and collapse inner whitespace so spellings index together"""
+    return _WHITESPACE.sub(" ", str(skill)).strip().lower()
+
+
+def candidate_skills(candidate: Candidate) -> Set[str]:
+    """Collect a candidate's normalized technical and soft skills"""
+    parsed_resume = candidate.parsed_resume
+    return {
+        normalize_skill(skill)
+        for skill in parsed_resume.technical_skills + parsed_resume.soft_skills
+        if normalize_skill(skill)
+    }
+
+
+class SkillIndex:
+    """
+    Inverted index from normalized skill to the ids of candidates listing it.
+
+    Fed with search and ranking results as they arrive; re-adding a candidate
+    replaces its postings. Answers AND/OR queries, "at least k of these"
+    queries and skill prefix completion from memory.
+    """
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._skills_by_candidate: Dict[Hashable, Set[str]] = {}
+        self._candidates: Dict[Hashable, Candidate] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_stale = False
+        self._lock = threading.Lock()
+
+    def add(self, candidates: Iterable[Candidate]) -> int:
+        """
+        Index (or re-index) candidates
+
+        Args:
+            candidates (Iterable[Candidate]): Candidate records; records without an id are skipped
+
+        Returns:
+            int: Number of candidates indexed
+        """
+        added = 0
+        with self._lock:
+            for candidate in candidates:
+                candidate_id = candidate.id
+                if candidate_id is None:
+                    continue
+                skills = candidate_skills(candidate)
+                previous = self._skills_by_candidate.get(candidate_id, set())
+                for skill in previous - skills:
+                    postings = self._postings[skill]
+                    postings.discard(candidate_id)
+                    if not postings:
+                        del self._postings[skill]
+                        self._vocabulary_stale = True
+                for skill in skills - previous:
+                    if skill not in self._postings:
+                        self._postings[skill] = set()
+                        self._vocabulary_stale = True
+                    self._postings[skill].add(candidate_id)
+                self._skills_by_candidate[candidate_id] = skills
+                self._candidates[candidate_id] = candidate
+                added += 1
+        return added
+
+    def query_all(self, skills: Iterable[str]) -> Set[Hashable]:
+        """Return ids of candidates having every one of the skills"""
+        normalized = {normalize_skill(skill) for skill in skills}
+        with self._lock:
+            # Intersect starting from the rarest skill to keep sets small
+            postings = sorted((self._postings.get(skill, set()) for skill in normalized), key=len)
+            if not postings:
+                return set()
+            result = set(postings[0])
+            for posting in postings[1:]:
+                result &= posting
+                if not result:
+                    break
+            return result
+
+    def query_any(self, skills: Iterable[str]) -> Set[Hashable]:
+        """Return ids of candidates having at least one of the skills"""
+        with self._lock:
+            result: Set[Hashable] = set()
+            for skill in {normalize_skill(skill) for skill in skills}:
+                result |= self._postings.get(skill, set())
+            return result
+
+    def match_counts(self, skills: Iterable[str]) -> Counter:
+        """Count, per candidate, how many of the skills they have"""
+        with self._lock:
+            counts: Counter = Counter()
+            for skill in {normalize_skill(skill) for skill in skills}:
+                counts.update(self._postings.get(skill, ()))
+            return counts
+
+    def query_at_least(self, skills: Iterable[str], k: int) -> Set[Hashable]:
+        """Return ids of candidates having at least ``k`` of the skills"""
+        return {candidate_id for candidate_id, count in self.match_counts(skills).items() if count >= k}
+
+    def _refresh_vocabulary(self) -> None:
+        """Re-sort the skill list after skills were added or removed; the caller must hold the lock"""
+        if self._vocabulary_stale:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_stale = False
+
+    def vocabulary(self) -> List[str]:
+        """Return every indexed skill in sorted order"""
+        with self._lock:
+            self._refresh_vocabulary()
+            return list(self._vocabulary)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Suggest indexed skills starting with a prefix, most common first
+
+        Args:
+            prefix (str): Typed prefix, matched case-insensitively
+            limit (int): Maximum suggestions
+
+        Returns:
+            List[str]: Normalized skills
+        """
+        prefix = normalize_skill(prefix)
+        if not prefix:
+            return []
+        with self._lock:
+            self._refresh_vocabulary()
+            matches = []
+            for position in range(bisect_left(self._vocabulary, prefix), len(self._vocabulary)):
+                skill = self._vocabulary[position]
+                if not skill.startswith(prefix):
+                    break
+                matches.append(skill)
+            matches.sort(key=lambda skill: -len(self._postings[skill]))
+            return matches[:limit]
+
+    def candidates(self, candidate_ids: Iterable[Hashable]) -> List[Candidate]:
+        """Return the indexed records for ids, skipping unknown ones"""
+        with self._lock:
+            return [self._candidates[candidate_id] for candidate_id in candidate_ids if candidate_id in self._candidates]
+
+    def candidate_count(self, skill: Optional[str] = None) -> int:
+        """Number of indexed candidates, or of candidates listing one skill"""
+        with self._lock:
+            if skill is None:
+                return len(self._skills_by_candidate)
+            return len(self._postings.get(normalize_skill(skill), ()))
+
+    def stats(self) -> Dict[str, int]:
+        """Report how many candidates and distinct skills are indexed"""
+        with self._lock:
+            return {"candidates": len(self._skills_by_candidate), "skills": len(self._postings)}
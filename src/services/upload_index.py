@@ -0,0 +1,96 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import BinaryIO, Optional, Tuple, Union
+import streamlit as st
+from src.utils.custom_logger import CustomLogger
+
+logger = CustomLogger("UploadIndex")
+
+UPLOAD_INDEX_MAX_USERS = int(os.getenv("UPLOAD_INDEX_MAX_USERS", "10000"))
+UPLOAD_INDEX_MAX_AGE = float(os.getenv("UPLOAD_INDEX_MAX_AGE", str(24 * 60 * 60)))
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def content_hash(source: Union[str, bytes, bytearray, memoryview, BinaryIO]) -> str:
+    """
+    Compute the SHA-256 of a resume without loading files into memory at once
+
+    Args:
+        source: Path on disk, in-memory buffer or binary file object
+
+    Returns:
+        str: Hex digest of the content
+    """
+    digest = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        digest.update(source)
+    elif isinstance(source, str):
+        with open(source, "rb") as file:
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    else:
+        source.seek(0)
+        for chunk in iter(lambda: source.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        source.seek(0)
+    return digest.hexdigest()
+
+
+class UploadIndex:
+    """
+    Remembers the content hash of each user's latest uploaded resume so an
+    unchanged file does not have to be sent and re-parsed again.
+
+    Only the latest upload counts: the backend keeps one resume per user, so
+    re-uploading an older file replaces what it holds and must be sent.
+    """
+
+    def __init__(self, max_users: int = UPLOAD_INDEX_MAX_USERS, max_age: float = UPLOAD_INDEX_MAX_AGE):
+        """
+        Initialize the upload index
+
+        Args:
+            max_users (int): Users tracked before the least recent is dropped
+            max_age (float): Seconds after which a remembered upload is ignored
+        """
+        self.max_users = max_users
+        self.max_age = max_age
+        self._latest: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_latest(self, user_id: str, digest: str) -> bool:
+        """Check whether content with this hash is the user's latest upload"""
+        with self._lock:
+            latest = self._latest.get(str(user_id))
+            if latest is None or latest[0] != digest:
+                return False
+            if time.time() - latest[1] > self.max_age:
+                del self._latest[str(user_id)]
+                return False
+            return True
+
+    def record(self, user_id: str, digest: str) -> None:
+        """Remember a successful upload as the user's latest"""
+        with self._lock:
+            self._latest[str(user_id)] = (digest, time.time())
+            self._latest.move_to_end(str(user_id))
+            while len(self._latest) > self.max_users:
+                self._latest.popitem(last=False)
+
+    def forget(self, user_id: Optional[str] = None) -> None:
+        """Drop remembered uploads for one user, or for everyone"""
+        with self._lock:
+            if user_id is None:
+                self._latest.clear()
+            else:
+                self._latest.pop(str(user_id), None)
+
+
+@st.cache_resource
+def get_upload_index() -> UploadIndex:
+    """Return the process-wide upload index"""
+    return UploadIndex()
@@ -0,0 +1,116 @@
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Awaitable, List, Optional
+import streamlit as st
+from src.utils.custom_logger import CustomLogger
+from src.utils.profiler import network_timer
+
+logger = CustomLogger("AsyncRunner")
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Thread target that drives an event loop until it is stopped"""
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+    loop.close()
+
+
+def _stop_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Ask a running loop to stop from any thread"""
+    if loop.is_running():
+        loop.call_soon_threadsafe(loop.stop)
+
+
+class AsyncRunner:
+    """
+    Runs coroutines on a long-lived event loop owned by a background thread.
+
+    Streamlit executes the page script synchronously, so instead of spinning up
+    a fresh loop with ``asyncio.run`` for every call, coroutines are submitted to
+    this loop. Calls submitted together (see ``gather``) genuinely overlap.
+    """
+
+    def __init__(self, name: str = "AsyncRunner"):
+        """
+        Initialize the runner and start its loop thread
+
+        Args:
+            name (str): Name given to the loop thread
+        """
+        self._loop = asyncio.new_event_loop()
+        # The thread only references the loop, so the runner itself can be
+        # garbage collected (stopping the loop) once nothing holds it.
+        self._thread = threading.Thread(target=_run_loop, args=(self._loop,), name=name, daemon=True)
+        self._thread.start()
+        self._finalizer = weakref.finalize(self, _stop_loop, self._loop)
+        logger.info(f"{name} started")
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def submit(self, coro: Awaitable) -> Future:
+        """
+        Schedule a coroutine without waiting for it
+
+        Args:
+            coro (Awaitable): Coroutine to schedule
+
+        Returns:
+            Future: Thread-safe future resolving to the coroutine result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the loop and block until it completes
+
+        Args:
+            coro (Awaitable): Coroutine to run
+            timeout (float, optional): Seconds to wait for the result
+
+        Returns:
+            Any: Result of the coroutine
+        """
+        return self.submit(coro).result(timeout)
+
+    def gather(self, *coros: Awaitable, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Run several coroutines concurrently and return their results in order
+
+        Exceptions are returned in place of results rather than raised.
+        """
+        async def _gather():
+            return await asyncio.gather(*coros, return_exceptions=True)
+
+        return self.run(_gather(), timeout)
+
+    def stop(self) -> None:
+        """Stop the loop thread"""
+        self._finalizer()
+
+
+@st.cache_resource
+def get_runner() -> AsyncRunner:
+    """
+    Return the process-wide runner shared by every Streamlit session
+
+    The shared HTTP connection pool is bound to this runner's loop, so all
+    sessions submit their coroutines here. Calls still overlap because the
+    loop never blocks on I/O.
+    """
+    return AsyncRunner(name="SharedAsyncRunner")
+
+
+def run_async(coro: Awaitable, timeout: Optional[float] = None) -> Any:
+    """Run a coroutine on the shared runner and return its result"""
+    with network_timer():
+        return get_runner().run(coro, timeout)
+
+
+def gather_async(*coros: Awaitable, timeout: Optional[float] = None) -> List[Any]:
+    """Run coroutines concurrently on the shared runner"""
+    with network_timer():
+        return get_runner().gather(*coros, timeout=timeout)
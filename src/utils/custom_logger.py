@@ -1,16 +1,270 @@
+import atexit
+import glob
+import json
 import logging
 import os
-from datetime import datetime
-from typing import Optional
+import queue
+import random
+import threading
+from datetime import date, datetime, timedelta, timezone
+from logging.handlers import BaseRotatingHandler, QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional, Tuple
 from colorama import Fore, Style, init
 
 # Initialize colorama
 init(autoreset=True)
 
+# Hand records to a background thread for formatting and I/O
+LOG_ASYNC = os.getenv("LOG_ASYNC", "true").lower() in ("1", "true", "yes")
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+# What to do when the queue is full: drop_newest, drop_oldest or block
+LOG_OVERFLOW_POLICY = os.getenv("LOG_OVERFLOW_POLICY", "drop_oldest")
+# Extra queue slots only ERROR and CRITICAL records may use
+LOG_ERROR_RESERVE = int(os.getenv("LOG_ERROR_RESERVE", "500"))
+
+# Shared log file, rotated daily or when it reaches LOG_MAX_BYTES
+LOG_DIR = os.getenv("LOG_DIR", "logs")
+LOG_FILE_NAME = os.getenv("LOG_FILE_NAME", "app")
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(50 * 1024 * 1024)))
+LOG_RETENTION_DAYS = int(os.getenv("LOG_RETENTION_DAYS", "14"))
+
+# Emit one JSON object per line instead of the text format
+LOG_JSON = os.getenv("LOG_JSON", "false").lower() in ("1", "true", "yes")
+# Longest rendered argument or message kept before truncation
+LOG_MAX_FIELD_CHARS = int(os.getenv("LOG_MAX_FIELD_CHARS", "2000"))
+# Fraction of DEBUG/INFO records kept per logger, e.g. "MainApp=0.1,JobListener=0.5"
+LOG_SAMPLE_RATES = {
+    name.strip(): float(rate)
+    for name, rate in (
+        item.split("=", 1) for item in os.getenv("LOG_SAMPLE_RATES", "").split(",") if "=" in item
+    )
+}
+
+# Longest the exit handler waits for room to tell the listener thread to stop
+LOG_SHUTDOWN_TIMEOUT = 5.0
+
+DEFAULT_LOG_FORMAT = '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s'
+
+
+def truncate(text: str, max_chars: int = LOG_MAX_FIELD_CHARS) -> str:
+    """Shorten text longer than ``max_chars``, noting how much was cut"""
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}... [{len(text) - max_chars} chars truncated]"
+
+
+class LazyArg:
+    """
+    Log argument rendered only when a handler formats the record.
+
+    Wraps callables (called at format time) and strings (truncated at format
+    time), so records that are filtered out or sampled away never pay for
+    rendering them. Mutable containers are captured with ``snapshot`` when
+    the record is logged, because formatting happens later on the listener
+    thread and the caller may change them in the meantime.
+    """
+
+    __slots__ = ("value", "rendered")
+
+    def __init__(self, value: Any, rendered: bool = False):
+        self.value = value
+        self.rendered = rendered
+
+    @classmethod
+    def snapshot(cls, value: Any) -> "LazyArg":
+        """Render a dict, list, set or tuple now; only truncation is deferred"""
+        return cls(repr(value), rendered=True)
+
+    def _render(self) -> str:
+        if self.rendered:
+            return truncate(self.value)
+        value = self.value() if callable(self.value) else self.value
+        return truncate(value if isinstance(value, str) else str(value))
+
+    def __str__(self) -> str:
+        return self._render()
+
+    def __repr__(self) -> str:
+        if self.rendered:
+            return truncate(self.value)
+        value = self.value() if callable(self.value) else self.value
+        return truncate(repr(value))
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as single-line JSON objects"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": truncate(record.getMessage()),
+            "thread": record.threadName
+        }
+        if record.exc_info:
+            entry["exception"] = truncate(self.formatException(record.exc_info))
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Queue handler that keeps the calling thread from blocking on a full queue.
+
+    Records are enqueued as-is so that message formatting happens on the
+    listener thread. Only ERROR and above may use the last ``error_reserve``
+    slots of the queue, so an overflow of routine records cannot crowd them
+    out; once the queue is truly full they are dropped and counted rather
+    than stalling the caller, which is often the shared event loop. For
+    other records the overflow policy decides which record is lost.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        overflow_policy: str = LOG_OVERFLOW_POLICY,
+        error_reserve: int = LOG_ERROR_RESERVE
+    ):
+        super().__init__(log_queue)
+        self.overflow_policy = overflow_policy
+        self.limit = max(1, log_queue.maxsize - error_reserve) if log_queue.maxsize > 0 else 0
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if record.levelno >= logging.ERROR:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+            return
+
+        if not self.limit or self.queue.qsize() < self.limit:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                pass
+
+        if self.overflow_policy == "block":
+            self.queue.put(record)
+        elif self.overflow_policy == "drop_oldest":
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.dropped += 1
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+        else:
+            self.dropped += 1
+
+
+class DrainingQueueListener(QueueListener):
+    """
+    Queue listener whose ``stop`` waits for room for its sentinel.
+
+    The stock ``stop`` enqueues the sentinel with ``put_nowait`` and raises
+    ``queue.Full`` when the bounded queue is full at exit, so the thread is
+    never joined and queued records are lost.
+    """
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        try:
+            # The listener keeps draining, so room appears unless it is stuck
+            self.queue.put(self._sentinel, timeout=LOG_SHUTDOWN_TIMEOUT)
+        except queue.Full:
+            return
+        self._thread.join()
+        self._thread = None
+
+
+class DailyRotatingFileHandler(BaseRotatingHandler):
+    """
+    File handler that rotates at local midnight or once the file reaches
+    ``max_bytes``, and deletes rotated files older than ``retention_days``.
+
+    Rotated files are named ``<name>.<YYYYMMDD>.<n><ext>`` next to the live file.
+    """
+
+    def __init__(self, filename: str, max_bytes: int = 0, retention_days: int = 0):
+        """
+        Initialize the rotating file handler
+
+        Args:
+            filename (str): Path of the live log file
+            max_bytes (int): Size that triggers a rotation (0 for no cap)
+            retention_days (int): Days rotated files are kept (0 keeps them all)
+        """
+        super().__init__(filename, "a", encoding="utf-8", delay=True)
+        self.max_bytes = max_bytes
+        self.retention_days = retention_days
+        self._root, self._ext = os.path.splitext(self.baseFilename)
+        self._day = self._file_day()
+        self._purge()
+
+    def _file_day(self) -> date:
+        """Day the live file belongs to, based on its last write"""
+        if os.path.exists(self.baseFilename):
+            return date.fromtimestamp(os.path.getmtime(self.baseFilename))
+        return date.today()
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if date.today() != self._day:
+            return True
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.seek(0, 2)
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    def doRollover(self) -> None:
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if os.path.exists(self.baseFilename):
+            stamp = self._day.strftime("%Y%m%d")
+            index = 1
+            while os.path.exists(f"{self._root}.{stamp}.{index}{self._ext}"):
+                index += 1
+            self.rotate(self.baseFilename, f"{self._root}.{stamp}.{index}{self._ext}")
+        self._day = date.today()
+        self._purge()
+
+    def _purge(self) -> None:
+        """Delete rotated files older than the retention window"""
+        if self.retention_days <= 0:
+            return
+        cutoff = (date.today() - timedelta(days=self.retention_days)).strftime("%Y%m%d")
+        for path in glob.glob(f"{glob.escape(self._root)}.*{self._ext}"):
+            stamp = path[len(self._root) + 1:].split(".", 1)[0]
+            if len(stamp) == 8 and stamp.isdigit() and stamp < cutoff:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
 class CustomLogger:
     """
     Custom logger class that provides colored console output and clean log files
+
+    Every logger writes to one shared, rotating file sink and one console
+    handler (or, in async mode, to one queue feeding them), so the number of
+    open files does not grow with the number of logger names. Creating the
+    same logger again reuses what is already attached.
     """
+
+    # Output handlers per (log file, format, async, json) sink, shared by logger names
+    _sinks: Dict[Tuple[str, str, bool, bool], List[logging.Handler]] = {}
+    _sinks_lock = threading.Lock()
     
     # Color mapping for different log levels
     COLORS = {
@@ -26,41 +280,81 @@ class CustomLogger:
         name: str,
         log_file: Optional[str] = None,
         level: int = logging.INFO,
-        log_format: Optional[str] = None
+        log_format: Optional[str] = None,
+        async_mode: bool = LOG_ASYNC,
+        json_mode: bool = LOG_JSON,
+        sample_rate: Optional[float] = None
     ):
         """
         Initialize the custom logger
         
         Args:
             name (str): Logger name
-            log_file (str, optional): Path to log file
+            log_file (str, optional): Path to log file, defaults to the shared application log
             level (int): Logging level
             log_format (str, optional): Custom log format
+            async_mode (bool): Format and write records on a background thread
+            json_mode (bool): Write structured JSON lines instead of text
+            sample_rate (float, optional): Fraction of DEBUG/INFO records kept,
+                defaults to this logger's LOG_SAMPLE_RATES entry or 1.0
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
+        self.sample_rate = LOG_SAMPLE_RATES.get(name, 1.0) if sample_rate is None else sample_rate
 
+        for handler in self._sink_handlers(log_file, log_format, async_mode, json_mode):
+            if handler not in self.logger.handlers:
+                self.logger.addHandler(handler)
+
+    @classmethod
+    def _sink_handlers(
+        cls,
+        log_file: Optional[str],
+        log_format: Optional[str],
+        async_mode: bool,
+        json_mode: bool
+    ) -> List[logging.Handler]:
+        """
+        Return the handlers for a sink, creating them the first time
+        
+        Returns:
+            List[logging.Handler]: Handlers to attach to a logger
+        """
         if not log_file:
-            log_dir = 'logs'
-            os.makedirs(log_dir, exist_ok=True)
-            log_file = os.path.join(log_dir, f'{name}_{datetime.now().strftime("%Y%m%d")}.log')
+            os.makedirs(LOG_DIR, exist_ok=True)
+            log_file = os.path.join(LOG_DIR, f"{LOG_FILE_NAME}.log")
+        log_file = os.path.abspath(log_file)
 
         if not log_format:
-            log_format = '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s'
-
-        # File handler (without color codes)
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(level)
-        file_formatter = logging.Formatter(log_format)
-        file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
-
-        # Console handler (with color codes)
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(level)
-        console_formatter = self.ColoredFormatter(log_format)
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+            log_format = DEFAULT_LOG_FORMAT
+
+        key = (log_file, log_format, async_mode, json_mode)
+        with cls._sinks_lock:
+            if key in cls._sinks:
+                return cls._sinks[key]
+
+            # File handler (without color codes)
+            file_handler = DailyRotatingFileHandler(log_file, LOG_MAX_BYTES, LOG_RETENTION_DAYS)
+            file_formatter = JsonFormatter() if json_mode else logging.Formatter(log_format)
+            file_handler.setFormatter(file_formatter)
+
+            # Console handler (with color codes unless writing JSON)
+            console_handler = logging.StreamHandler()
+            console_formatter = JsonFormatter() if json_mode else cls.ColoredFormatter(log_format)
+            console_handler.setFormatter(console_formatter)
+
+            if async_mode:
+                log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE + LOG_ERROR_RESERVE if LOG_QUEUE_SIZE > 0 else 0)
+                listener = DrainingQueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+                listener.start()
+                # Stopping the listener drains whatever is still queued
+                atexit.register(listener.stop)
+                handlers = [BoundedQueueHandler(log_queue)]
+            else:
+                handlers = [file_handler, console_handler]
+
+            cls._sinks[key] = handlers
+            return handlers
 
     class ColoredFormatter(logging.Formatter):
         """
@@ -85,20 +379,51 @@ class CustomLogger:
             
             return result
 
-    def debug(self, message: str) -> None:
-        self.logger.debug(message)
+    def dropped_count(self) -> int:
+        """Number of records this logger's queue has dropped on overflow"""
+        return sum(
+            handler.dropped for handler in self.logger.handlers
+            if isinstance(handler, BoundedQueueHandler)
+        )
+
+    def _log(self, level: int, message: Any, args: Tuple) -> None:
+        """
+        Log a record, deferring all rendering until a handler formats it
+
+        ``message`` may be a %-style format string used with ``args`` or a
+        callable returning the message. Callables and strings are only
+        rendered (and truncated) if the record is actually emitted; containers
+        are rendered once the record passes the level and sampling checks, so
+        later changes to them do not show up in the log.
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        if level < logging.WARNING and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        if callable(message):
+            message = LazyArg(message)
+        args = tuple(
+            LazyArg.snapshot(arg) if isinstance(arg, (dict, list, tuple, set))
+            else LazyArg(arg) if callable(arg) or isinstance(arg, str)
+            else arg
+            for arg in args
+        )
+        self.logger.log(level, message, *args, stacklevel=3)
+
+    def debug(self, message: Any, *args: Any) -> None:
+        self._log(logging.DEBUG, message, args)
 
-    def info(self, message: str) -> None:
-        self.logger.info(message)
+    def info(self, message: Any, *args: Any) -> None:
+        self._log(logging.INFO, message, args)
 
-    def warning(self, message: str) -> None:
-        self.logger.warning(message)
+    def warning(self, message: Any, *args: Any) -> None:
+        self._log(logging.WARNING, message, args)
 
-    def error(self, message: str) -> None:
-        self.logger.error(message)
+    def error(self, message: Any, *args: Any) -> None:
+        self._log(logging.ERROR, message, args)
 
-    def critical(self, message: str) -> None:
-        self.logger.critical(message)
+    def critical(self, message: Any, *args: Any) -> None:
+        self._log(logging.CRITICAL, message, args)
 
 # Usage example
 if __name__ == "__main__":
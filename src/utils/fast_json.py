@@ -0,0 +1,44 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Falls back to the standard library decoder
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed
+
+    Args:
+        data (bytes | str): Encoded document; bytes are decoded without an
+            intermediate string copy when orjson is available
+
+    Returns:
+        Any: The decoded value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any, sort_keys: bool = False) -> str:
+    """
+    Encode a value as compact JSON, using orjson when it is installed
+
+    Values JSON cannot represent are encoded with ``str``.
+
+    Args:
+        value (Any): Value to encode
+        sort_keys (bool): Sort object keys, for a canonical form
+
+    Returns:
+        str: The encoded document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(value, default=str, option=option).decode("utf-8")
+    return json.dumps(value, sort_keys=sort_keys, default=str, separators=(",", ":"))
@@ -0,0 +1,344 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from src.utils.custom_logger import CustomLogger
+
+logger = CustomLogger("Metrics")
+
+# Optional exports: a Prometheus scrape endpoint and/or a periodically written file
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+METRICS_FILE = os.getenv("METRICS_FILE", "")
+METRICS_FILE_INTERVAL = float(os.getenv("METRICS_FILE_INTERVAL", "15"))
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# (metric name, help text, type, [(labels, value)])
+MetricFamily = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def stats_families(prefix: str, description: str, stats: Dict[str, float]) -> List[MetricFamily]:
+    """
+    Turn a component's ``stats()`` dict into one gauge per numeric field
+
+    Args:
+        prefix (str): Metric name prefix, e.g. "response_cache"
+        description (str): Component description used in help text
+        stats (Dict[str, float]): Counters reported by the component
+
+    Returns:
+        List[MetricFamily]: Families named ``<prefix>_<field>``
+    """
+    return [
+        (f"{prefix}_{field}", f"{description}: {field.replace('_', ' ')}", "gauge", [({}, value)])
+        for field, value in stats.items()
+        if isinstance(value, (int, float))
+    ]
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus style"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket it falls in"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            if running >= target:
+                return bound
+        return float("inf")
+
+
+class EndpointStats:
+    """Everything recorded for one (method, route) pair"""
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.statuses: Dict[str, int] = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+        # Bytes not transferred, by reason ("compression", "not_modified")
+        self.saved_bytes: Dict[str, int] = {}
+
+
+class MetricsRegistry:
+    """
+    Process-wide store of per-endpoint backend call metrics.
+
+    The HTTP client records one observation per backend call, retries
+    included; callers that joined an in-flight call are not counted again. Other components register sources that contribute gauges
+    such as cache hit counts or circuit breaker state at export time.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self._endpoints: Dict[Tuple[str, str], EndpointStats] = {}
+        self._sources: Dict[str, Callable[[], List[MetricFamily]]] = {}
+        self._lock = threading.Lock()
+
+    def record_request(
+        self,
+        method: str,
+        route: str,
+        status: str,
+        latency: float,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+        retries: int = 0
+    ) -> None:
+        """
+        Record one completed (or failed) backend call
+
+        Args:
+            method (str): HTTP method
+            route (str): Route template, e.g. "/job/jobs/{job_id}"
+            status (str): Status code, or the error type for failed calls
+            latency (float): Seconds spent, including retries
+            request_bytes (int): Bytes sent in the request body
+            response_bytes (int): Bytes received in the response body
+            retries (int): Retries made before the final outcome
+        """
+        with self._lock:
+            stats = self._endpoints.setdefault((method, route), EndpointStats())
+            stats.latency.observe(latency)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            stats.retries += retries
+
+    def record_saved(self, method: str, route: str, reason: str, saved_bytes: int) -> None:
+        """
+        Record response bytes that did not have to cross the network
+
+        Args:
+            method (str): HTTP method
+            route (str): Route template, e.g. "/job/jobs/{job_id}"
+            reason (str): "compression" or "not_modified"
+            saved_bytes (int): Bytes saved compared to an uncompressed full response
+        """
+        if saved_bytes <= 0:
+            return
+        with self._lock:
+            stats = self._endpoints.setdefault((method, route), EndpointStats())
+            stats.saved_bytes[reason] = stats.saved_bytes.get(reason, 0) + saved_bytes
+
+    def register_source(self, name: str, source: Callable[[], List[MetricFamily]]) -> None:
+        """
+        Add a callable contributing extra metric families at export time
+
+        Registering again under the same name replaces the earlier source, so
+        a re-created component does not report twice or keep the old one alive.
+
+        Args:
+            name (str): Unique name of the contributing component
+            source (Callable): Returns the component's metric families
+        """
+        with self._lock:
+            self._sources[name] = source
+
+    def unregister_source(self, name: str) -> None:
+        """Stop exporting a component's metric families"""
+        with self._lock:
+            self._sources.pop(name, None)
+
+    def summary(self) -> List[Dict]:
+        """
+        Summarize each endpoint for display
+
+        Returns:
+            List[Dict]: One row per (method, route) with counts, latency estimates, bytes and bytes saved
+        """
+        with self._lock:
+            rows = []
+            for (method, route), stats in sorted(self._endpoints.items(), key=lambda item: item[0][1]):
+                errors = sum(
+                    count for status, count in stats.statuses.items()
+                    if not status.isdigit() or int(status) >= 400
+                )
+                rows.append({
+                    "method": method,
+                    "route": route,
+                    "requests": stats.latency.count,
+                    "errors": errors,
+                    "avg_ms": round(1000 * stats.latency.total / stats.latency.count, 1) if stats.latency.count else 0.0,
+                    "p50_ms": 1000 * stats.latency.quantile(0.5),
+                    "p95_ms": 1000 * stats.latency.quantile(0.95),
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                    "saved_bytes": sum(stats.saved_bytes.values()),
+                    "not_modified": stats.statuses.get("304", 0),
+                    "retries": stats.retries
+                })
+            return rows
+
+    def render_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format
+
+        Returns:
+            str: Exposition text
+        """
+        lines: List[str] = []
+        with self._lock:
+            endpoints = list(self._endpoints.items())
+            sources = list(self._sources.values())
+
+            lines += [
+                "# HELP backend_request_duration_seconds Latency of backend calls, retries included",
+                "# TYPE backend_request_duration_seconds histogram"
+            ]
+            for (method, route), stats in endpoints:
+                running = 0
+                for bound, count in zip(stats.latency.buckets, stats.latency.counts):
+                    running += count
+                    labels = _labels({"method": method, "route": route, "le": str(bound)})
+                    lines.append(f"backend_request_duration_seconds_bucket{labels} {running}")
+                labels = _labels({"method": method, "route": route, "le": "+Inf"})
+                lines.append(f"backend_request_duration_seconds_bucket{labels} {stats.latency.count}")
+                labels = _labels({"method": method, "route": route})
+                lines.append(f"backend_request_duration_seconds_sum{labels} {stats.latency.total}")
+                lines.append(f"backend_request_duration_seconds_count{labels} {stats.latency.count}")
+
+            lines += [
+                "# HELP backend_requests_total Backend calls by final status code or error type",
+                "# TYPE backend_requests_total counter"
+            ]
+            for (method, route), stats in endpoints:
+                for status, count in sorted(stats.statuses.items()):
+                    labels = _labels({"method": method, "route": route, "status": status})
+                    lines.append(f"backend_requests_total{labels} {count}")
+
+            for name, help_text, attribute in (
+                ("backend_request_bytes_total", "Request body bytes sent", "request_bytes"),
+                ("backend_response_bytes_total", "Response body bytes received on the wire", "response_bytes"),
+                ("backend_request_retries_total", "Retries made for backend calls", "retries")
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for (method, route), stats in endpoints:
+                    labels = _labels({"method": method, "route": route})
+                    lines.append(f"{name}{labels} {getattr(stats, attribute)}")
+
+            lines += [
+                "# HELP backend_response_bytes_saved_total Response bytes not transferred thanks to compression or 304 reuse",
+                "# TYPE backend_response_bytes_saved_total counter"
+            ]
+            for (method, route), stats in endpoints:
+                for reason, saved in sorted(stats.saved_bytes.items()):
+                    labels = _labels({"method": method, "route": route, "reason": reason})
+                    lines.append(f"backend_response_bytes_saved_total{labels} {saved}")
+
+        # Sources may share family names (e.g. one HTTP client per backend);
+        # their samples are merged so each family is declared once
+        merged: Dict[str, MetricFamily] = {}
+        for source in sources:
+            try:
+                families = source()
+            except Exception as e:
+                logger.error("Metrics source failed: %s", str(e))
+                continue
+            for name, help_text, metric_type, samples in families:
+                if name in merged:
+                    merged[name][3].extend(samples)
+                else:
+                    merged[name] = (name, help_text, metric_type, list(samples))
+        for name, help_text, metric_type, samples in merged.values():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+            for labels, value in samples:
+                lines.append(f"{name}{_labels(labels)} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_file(self, path: str) -> None:
+        """Atomically write the Prometheus exposition text to a file"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(self.render_prometheus())
+        os.replace(temp_path, path)
+
+
+def _start_http_exporter(registry: MetricsRegistry, port: int) -> None:
+    """Serve the registry on http://0.0.0.0:<port>/metrics from a daemon thread"""
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    try:
+        server = ThreadingHTTPServer(("0.0.0.0", port), MetricsHandler)
+    except OSError as e:
+        # Another worker on this node already serves the port
+        logger.warning("Metrics endpoint not started on port %s: %s", port, str(e))
+        return
+    threading.Thread(target=server.serve_forever, name="MetricsExporter", daemon=True).start()
+    logger.info("Serving metrics on port %s", port)
+
+
+def _start_file_exporter(registry: MetricsRegistry, path: str, interval: float) -> None:
+    """Rewrite the metrics file every ``interval`` seconds from a daemon thread"""
+
+    def run():
+        while True:
+            time.sleep(interval)
+            try:
+                registry.write_file(path)
+            except OSError as e:
+                logger.error("Could not write metrics file %s: %s", path, str(e))
+
+    threading.Thread(target=run, name="MetricsFileExporter", daemon=True).start()
+    logger.info("Writing metrics to %s every %ss", path, interval)
+
+
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Return the process-wide metrics registry, starting configured exporters once"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = MetricsRegistry()
+            if METRICS_PORT:
+                _start_http_exporter(_registry, METRICS_PORT)
+            if METRICS_FILE:
+                _start_file_exporter(_registry, METRICS_FILE, METRICS_FILE_INTERVAL)
+        return _registry
@@ -0,0 +1,226 @@
+import cProfile
+import functools
+import hmac
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterator, Optional
+import streamlit as st
+from src.utils.custom_logger import CustomLogger
+
+logger = CustomLogger("Profiler")
+
+# Profile every rerun, or only reruns whose URL carries ?profile=<PROFILE_KEY>
+PROFILE_RERUNS = os.getenv("PROFILE_RERUNS", "false").lower() in ("1", "true", "yes")
+# Key for the ?profile= query parameter; the toggle is disabled when unset
+PROFILE_KEY = os.getenv("PROFILE_KEY", os.getenv("ADMIN_KEY", ""))
+# Also capture a cProfile dump and/or tracemalloc snapshot per profiled rerun
+PROFILE_CPU = os.getenv("PROFILE_CPU", "false").lower() in ("1", "true", "yes")
+PROFILE_MEMORY = os.getenv("PROFILE_MEMORY", "false").lower() in ("1", "true", "yes")
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+# reruns.jsonl is rotated to reruns.jsonl.1 once it grows past this size
+PROFILE_LOG_MAX_BYTES = int(os.getenv("PROFILE_LOG_MAX_BYTES", str(50 * 1024 * 1024)))
+
+_current = threading.local()
+_element_hook_lock = threading.Lock()
+_element_hook_installed = False
+# tracemalloc is process-wide: count the profiled reruns using it and only
+# stop it when the last one ends, and only if profiling started it
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_owned = False
+
+
+class RerunProfile:
+    """Timings and element counts collected during one script rerun"""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.started = time.perf_counter()
+        self.sections: Dict[str, float] = {}
+        self.network_seconds = 0.0
+        self.elements = 0
+
+    def as_dict(self, total: float) -> Dict:
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "label": self.label,
+            "total_ms": round(1000 * total, 2),
+            "network_ms": round(1000 * self.network_seconds, 2),
+            "render_ms": round(1000 * max(0.0, total - self.network_seconds), 2),
+            "elements": self.elements,
+            "sections_ms": {name: round(1000 * seconds, 2) for name, seconds in self.sections.items()}
+        }
+
+
+def current_profile() -> Optional[RerunProfile]:
+    """Return the profile of the rerun running on this thread, if any"""
+    return getattr(_current, "profile", None)
+
+
+def _profile_requested() -> bool:
+    """Check whether the URL carries ?profile= with the right key"""
+    if not PROFILE_KEY:
+        return False
+    try:
+        if hasattr(st, "query_params"):
+            value = st.query_params.get("profile")
+        else:
+            value = st.experimental_get_query_params().get("profile", [None])[0]
+    except Exception:
+        return False
+    return value is not None and hmac.compare_digest(str(value), PROFILE_KEY)
+
+
+def _acquire_tracemalloc() -> None:
+    """Register a profiled rerun that needs tracemalloc, starting it if nobody else did"""
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_owned = True
+        _tracemalloc_users += 1
+
+
+def _release_tracemalloc() -> None:
+    """Unregister a profiled rerun, stopping tracemalloc after the last one if profiling started it"""
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_owned:
+            tracemalloc.stop()
+            _tracemalloc_owned = False
+
+
+def _install_element_hook() -> None:
+    """
+    Count element deltas by wrapping DeltaGenerator._enqueue once per process
+
+    Every st.* element call passes through this internal method; if a
+    Streamlit version does not have it, element counts stay at zero.
+    """
+    global _element_hook_installed
+    with _element_hook_lock:
+        if _element_hook_installed:
+            return
+        _element_hook_installed = True
+        try:
+            from streamlit.delta_generator import DeltaGenerator
+            original = DeltaGenerator._enqueue
+        except (ImportError, AttributeError):
+            logger.warning("Element counting unavailable in this Streamlit version")
+            return
+
+        @functools.wraps(original)
+        def counting_enqueue(self, *args, **kwargs):
+            profile = current_profile()
+            if profile is not None:
+                profile.elements += 1
+            return original(self, *args, **kwargs)
+
+        DeltaGenerator._enqueue = counting_enqueue
+
+
+def _write_artifacts(profile: RerunProfile, summary: Dict, cpu: Optional[cProfile.Profile], snapshot) -> None:
+    """Append the rerun summary and write any cProfile/tracemalloc output"""
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    log_path = os.path.join(PROFILE_DIR, "reruns.jsonl")
+    if os.path.exists(log_path) and os.path.getsize(log_path) > PROFILE_LOG_MAX_BYTES:
+        os.replace(log_path, f"{log_path}.1")
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(summary) + "\n")
+    stem = os.path.join(PROFILE_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{profile.label}")
+    if cpu is not None:
+        cpu.dump_stats(f"{stem}.prof")
+    if snapshot is not None:
+        snapshot.dump(f"{stem}.tracemalloc")
+
+
+@contextmanager
+def profile_rerun(label: str = "rerun") -> Iterator[Optional[RerunProfile]]:
+    """
+    Profile one script rerun when profiling is switched on
+
+    Enabled by PROFILE_RERUNS or a ``?profile=<PROFILE_KEY>`` query
+    parameter. Section timings, time spent waiting on backend calls and the
+    number of element deltas are logged and appended to
+    ``PROFILE_DIR/reruns.jsonl``. Memory snapshots are process-wide, so with
+    several sessions profiled at once they include each other's allocations.
+
+    Args:
+        label (str): Name used in the summary and artifact filenames
+    """
+    if not (PROFILE_RERUNS or _profile_requested()) or current_profile() is not None:
+        yield None
+        return
+
+    _install_element_hook()
+    profile = RerunProfile(label)
+    _current.profile = profile
+    cpu = cProfile.Profile() if PROFILE_CPU else None
+    if PROFILE_MEMORY:
+        _acquire_tracemalloc()
+    if cpu is not None:
+        cpu.enable()
+    try:
+        yield profile
+    finally:
+        if cpu is not None:
+            cpu.disable()
+        snapshot = None
+        if PROFILE_MEMORY:
+            snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+            _release_tracemalloc()
+        _current.profile = None
+        summary = profile.as_dict(time.perf_counter() - profile.started)
+        logger.info("Rerun profile: %s", summary)
+        try:
+            _write_artifacts(profile, summary, cpu, snapshot)
+        except OSError as e:
+            logger.error("Could not write profile output: %s", str(e))
+
+
+@contextmanager
+def network_timer() -> Iterator[None]:
+    """Attribute the enclosed wait to backend calls in the current rerun profile"""
+    profile = current_profile()
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.network_seconds += time.perf_counter() - started
+
+
+def profile_section(name: Optional[str] = None) -> Callable:
+    """
+    Decorator timing a section renderer in the current rerun profile
+
+    Timings are inclusive of nested sections and accumulate if the same
+    section renders more than once in a rerun.
+
+    Args:
+        name (str, optional): Section name, defaults to the function name
+    """
+    def decorator(func: Callable) -> Callable:
+        section = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profile = current_profile()
+            if profile is None:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile.sections[section] = profile.sections.get(section, 0.0) + time.perf_counter() - started
+
+        return wrapper
+    return decorator